@@ -6,6 +6,35 @@ Shows the system's capabilities for research presentation
 from logic_reasoning import get_logic_reasoner
 from utils import detect_logical_keywords
 
+# Demonstration problems
+DEMO_PROBLEMS = [
+    {
+        "title": "Formal Logic Processing",
+        "problems": [
+            "A → B",
+            "A ∧ B", 
+            "A ∨ B",
+            "(A ∧ B) ∨ (¬A ∧ C)"
+        ]
+    },
+    {
+        "title": "Conditional Logic Analysis",
+        "problems": [
+            "If A then B",
+            "If it rains, the ground is wet",
+            "If A implies B, and B implies C, does A imply C?"
+        ]
+    },
+    {
+        "title": "Complex Logical Expressions",
+        "problems": [
+            "Prove that (A → B) ∧ (B → C) implies (A → C)",
+            "Is P ∨ ¬P always true?",
+            "What is the truth value of (P ∧ Q) ∨ (¬P ∧ ¬Q)?"
+        ]
+    }
+]
+
 def print_section(title):
     """Print a formatted section header."""
     print(f"\n{'='*60}")
@@ -32,44 +61,16 @@ def main():
     
     reasoner = get_logic_reasoner()
     
-    # Demonstration problems
-    demo_problems = [
-        {
-            "title": "Formal Logic Processing",
-            "problems": [
-                "A → B",
-                "A ∧ B", 
-                "A ∨ B",
-                "(A ∧ B) ∨ (¬A ∧ C)"
-            ]
-        },
-        {
-            "title": "Conditional Logic Analysis",
-            "problems": [
-                "If A then B",
-                "If it rains, the ground is wet",
-                "If A implies B, and B implies C, does A imply C?"
-            ]
-        },
-        {
-            "title": "Complex Logical Expressions",
-            "problems": [
-                "Prove that (A → B) ∧ (B → C) implies (A → C)",
-                "Is P ∨ ¬P always true?",
-                "What is the truth value of (P ∧ Q) ∨ (¬P ∧ ¬Q)?"
-            ]
-        }
-    ]
+    # Analyze each distinct problem once, even if it appears in several sections
+    analyses = {}
+    for problem in dict.fromkeys(p for demo in DEMO_PROBLEMS for p in demo['problems']):
+        analyses[problem] = (reasoner.reason(problem), detect_logical_keywords(problem))
     
-    for demo in demo_problems:
+    for demo in DEMO_PROBLEMS:
         print_section(f"{demo['title'].upper()}")
         
         for problem in demo['problems']:
-            # Detect features
-            features = detect_logical_keywords(problem)
-            
-            # Analyze
-            result = reasoner.reason(problem)
+            result, features = analyses[problem]
             
             # Display result
             print_result(problem, result, features)
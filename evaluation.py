@@ -3,29 +3,202 @@ Evaluation System for Dual Modality Reasoning Agent
 Tests the agent on predefined problems and generates performance metrics
 """
 
+import os
+import re
+import csv
+import math
 import time
-import pandas as pd
+import shelve
+import hashlib
+import functools
+import itertools
+import threading
 import logging
-from typing import Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, astuple, fields
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple, Optional, Callable, Mapping, FrozenSet, TYPE_CHECKING
 from integration import get_dual_modality_controller
 from natural_language import get_natural_language_reasoner
-from logic_reasoning import get_logic_reasoner
+from logic_reasoning import get_logic_reasoner, reasoner_fingerprint
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Semantic equivalents accepted when checking answers
+ANSWER_EQUIVALENTS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    'yes': frozenset(('true', 'correct', 'affirmative', 'positive')),
+    'no': frozenset(('false', 'incorrect', 'negative')),
+    'true': frozenset(('yes', 'correct', 'affirmative')),
+    'false': frozenset(('no', 'incorrect', 'negative')),
+    'passed': frozenset(('pass', 'success', 'successful')),
+    'weather not nice': frozenset(('not nice', 'bad weather', 'poor weather'))
+})
+
+def _build_equivalent_canonical() -> Dict[str, str]:
+    """Map every answer in the equivalents table to its canonical key (first entry mentioning it wins)."""
+    canonical = {}
+    for key, values in ANSWER_EQUIVALENTS.items():
+        canonical.setdefault(key, key)
+        for value in values:
+            canonical.setdefault(value, key)
+    return canonical
+
+_EQUIVALENT_CANONICAL: Mapping[str, str] = MappingProxyType(_build_equivalent_canonical())
+
+def _compile_equivalent_pattern(answer: str) -> re.Pattern:
+    """
+    Compile the accepted equivalents of an expected answer into one regex alternation.
+    
+    A canonical key matches any of its equivalents; a synonym matches its key or any sibling.
+    
+    Args:
+        answer (str): Lowercase expected answer present in the equivalents table
+        
+    Returns:
+        re.Pattern: Compiled matcher
+    """
+    key = _EQUIVALENT_CANONICAL[answer]
+    terms = ANSWER_EQUIVALENTS[key] if answer == key else ANSWER_EQUIVALENTS[key] | {key}
+    return re.compile('|'.join(re.escape(term) for term in sorted(terms, key=lambda t: (-len(t), t))))
+
+_EQUIVALENT_PATTERNS: Mapping[str, re.Pattern] = MappingProxyType({
+    answer: _compile_equivalent_pattern(answer) for answer in _EQUIVALENT_CANONICAL
+})
+
+def _reusable(sub_result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Get a controller sub-result for reuse by a single-mode trial, or None if it failed (so the trial reruns it)."""
+    return sub_result if sub_result is not None and sub_result.get('success') else None
+
+@dataclass
+class EvalRow:
+    """One flattened row of the detailed evaluation CSV."""
+    problem_id: int
+    problem: str
+    category: str
+    difficulty: str
+    expected_mode: str
+    expected_answer: str
+    dual_success: bool
+    dual_answer_correct: bool
+    dual_mode_correct: bool
+    dual_confidence: float
+    dual_time: float
+    dual_conclusion: str
+    dual_mode_selected: str
+    nl_success: bool
+    nl_answer_correct: bool
+    nl_confidence: float
+    nl_time: float
+    nl_conclusion: str
+    logic_success: bool
+    logic_answer_correct: bool
+    logic_confidence: float
+    logic_time: float
+    logic_conclusion: str
+    
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> 'EvalRow':
+        """
+        Build a row from one entry of the detailed evaluation results.
+        
+        Args:
+            result (Dict[str, Any]): Per-problem result from run_full_evaluation
+            
+        Returns:
+            EvalRow: Flattened row
+        """
+        dual = result['dual_modality']
+        nl = result['natural_language_only']
+        logic = result['logic_only']
+        return cls(
+            result['problem_id'], result['problem'], result['category'], result['difficulty'],
+            result['expected_mode'], result['expected_answer'],
+            dual['success'], dual['answer_correct'], dual['mode_correct'], dual['confidence'],
+            dual['processing_time'], dual['conclusion'], dual['mode_selected'],
+            nl['success'], nl['answer_correct'], nl['confidence'], nl['processing_time'], nl['conclusion'],
+            logic['success'], logic['answer_correct'], logic['confidence'], logic['processing_time'],
+            logic['conclusion']
+        )
+
+EVAL_ROW_COLUMNS = [field.name for field in fields(EvalRow)]
+
+# Trial fields reported when a reasoning backend raises
+_ERROR_TRIAL: Mapping[str, Any] = MappingProxyType({
+    'success': False,
+    'confidence': 0.0,
+    'answer_correct': False
+})
+_DUAL_ERROR_FIELDS: Mapping[str, Any] = MappingProxyType({
+    'mode_correct': False,
+    'mode_selected': 'Error'
+})
+
+# Metrics written to the summary CSV
+SUMMARY_METRICS = [
+    'dual_modality_accuracy',
+    'dual_modality_mode_accuracy',
+    'natural_language_accuracy',
+    'logic_reasoning_accuracy'
+]
+
+class DetailedCSVWriter:
+    """Result sink that appends each per-problem result to the detailed CSV as it completes."""
+    
+    def __init__(self, path: str):
+        """
+        Open the detailed CSV file and write its header.
+        
+        Args:
+            path (str): Output CSV path
+        """
+        self.path = path
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file, lineterminator='\n')
+        self._writer.writerow(EVAL_ROW_COLUMNS)
+    
+    def __call__(self, result: Dict[str, Any]):
+        """Write one per-problem result and flush it to disk."""
+        self._writer.writerow(astuple(EvalRow.from_result(result)))
+        self._file.flush()
+    
+    def close(self):
+        """Close the underlying file."""
+        self._file.close()
+    
+    def __enter__(self) -> 'DetailedCSVWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 class EvaluationSuite:
     """Evaluation suite for testing the dual modality reasoning agent."""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, max_workers: int = 8, max_concurrent_requests: int = 4,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the evaluation suite.
         
         Args:
             api_key (str, optional): Google AI API key for testing
+            max_workers (int): Number of test problems evaluated in parallel
+            max_concurrent_requests (int): Upper bound on simultaneous API-backed calls
+            cache_dir (str, optional): Directory for persisting backend results across runs
+                (e.g. '.eval_cache'). Only successful results are persisted.
         """
-        self.controller = get_dual_modality_controller(api_key)
-        self.nl_reasoner = get_natural_language_reasoner(api_key)
-        self.logic_reasoner = get_logic_reasoner()
+        self.max_workers = max_workers
+        self._api_semaphore = threading.Semaphore(max_concurrent_requests)
+        # Reasoning backends are built lazily on first use (see properties below)
+        self.api_key = api_key
+        
+        # Backend results are memoized per problem so repeated trials reuse them
+        self.cache_dir = cache_dir
+        self._cache_lock = threading.Lock()
+        self._cached_nl = functools.lru_cache(maxsize=512)(self._reason_nl)
+        self._cached_logic = functools.lru_cache(maxsize=512)(self._reason_logic)
         
         # Test problems with expected answers
         self.test_problems = [
@@ -111,10 +284,29 @@ class EvaluationSuite:
             }
         ]
     
-    def run_full_evaluation(self) -> Dict[str, Any]:
+    @functools.cached_property
+    def controller(self):
+        """Dual modality controller, constructed on first access."""
+        return get_dual_modality_controller(self.api_key)
+    
+    @functools.cached_property
+    def nl_reasoner(self):
+        """Natural language reasoner, constructed on first access."""
+        return get_natural_language_reasoner(self.api_key)
+    
+    @functools.cached_property
+    def logic_reasoner(self):
+        """Logic reasoner, constructed on first access."""
+        return get_logic_reasoner()
+    
+    def run_full_evaluation(self, sink: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Run the complete evaluation suite.
         
+        Args:
+            sink (Callable, optional): Called with each per-problem result as soon as it
+                is available (e.g. a DetailedCSVWriter)
+        
         Returns:
             Dict[str, Any]: Complete evaluation results
         """
@@ -123,36 +315,19 @@ class EvaluationSuite:
         results = []
         total_start_time = time.time()
         
-        # Test each problem
-        for test_case in self.test_problems:
-            logger.info(f"Testing problem {test_case['id']}: {test_case['problem'][:50]}...")
-            
-            # Test dual modality
-            dual_result = self._test_dual_modality(test_case)
-            
-            # Test natural language only
-            nl_result = self._test_natural_language_only(test_case)
-            
-            # Test logic only
-            logic_result = self._test_logic_only(test_case)
-            
-            # Combine results
-            result = {
-                'problem_id': test_case['id'],
-                'problem': test_case['problem'],
-                'category': test_case['category'],
-                'difficulty': test_case['difficulty'],
-                'expected_mode': test_case['expected_mode'],
-                'expected_answer': test_case['expected_answer'],
-                'dual_modality': dual_result,
-                'natural_language_only': nl_result,
-                'logic_only': logic_result
-            }
-            
-            results.append(result)
+        # Fan out the test problems so API round-trips overlap
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            jobs = []
+            for test_case in self.test_problems:
+                logger.info(f"Testing problem {test_case['id']}: {test_case['problem'][:50]}...")
+                jobs.append(executor.submit(self._evaluate_case, test_case))
             
-            # Small delay to avoid rate limiting
-            time.sleep(0.5)
+            # Collect in submission order so results keep the test-problem ordering
+            for job in jobs:
+                result = job.result()
+                results.append(result)
+                if sink is not None:
+                    sink(result)
         
         total_time = time.time() - total_start_time
         
@@ -165,111 +340,189 @@ class EvaluationSuite:
             'total_time': total_time
         }
     
+    def _evaluate_case(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Evaluate one test problem in all three modes.
+        
+        The dual modality run goes first so the NL and logic sub-results the
+        controller already computed can be reused by the single-mode trials.
+        
+        Args:
+            test_case (Dict[str, Any]): Test problem definition
+            
+        Returns:
+            Dict[str, Any]: Per-problem result
+        """
+        dual_result = self._test_dual_modality(test_case)
+        nl_intermediate = dual_result.pop('nl_intermediate', None)
+        logic_intermediate = dual_result.pop('logic_intermediate', None)
+        
+        return {
+            'problem_id': test_case['id'],
+            'problem': test_case['problem'],
+            'category': test_case['category'],
+            'difficulty': test_case['difficulty'],
+            'expected_mode': test_case['expected_mode'],
+            'expected_answer': test_case['expected_answer'],
+            'dual_modality': dual_result,
+            'natural_language_only': self._test_natural_language_only(test_case, nl_intermediate),
+            'logic_only': self._test_logic_only(test_case, logic_intermediate)
+        }
+    
     def _test_dual_modality(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
         """Test dual modality reasoning on a problem."""
-        start_time = time.time()
+        return self._run_timed(
+            'dual modality',
+            self._process_with_controller,
+            test_case,
+            extra_fields=lambda result: {
+                'mode_correct': result.get('mode_selection', {}).get('mode') == test_case['expected_mode'],
+                'mode_selected': result.get('mode_selection', {}).get('mode', 'Unknown'),
+                # The controller only uses the 'general' NL prompt in NL-only mode, so
+                # its NL result is comparable to the NL-only trial just in that case
+                'nl_intermediate': _reusable(result.get('natural_language')) if result.get('mode') == 'Natural Language Only' else None,
+                'logic_intermediate': _reusable(result.get('logic_reasoning'))
+            },
+            error_fields=_DUAL_ERROR_FIELDS
+        )
+    
+    def _test_natural_language_only(self, test_case: Dict[str, Any],
+                                    reused_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Test natural language reasoning only on a problem, reusing an existing result if given."""
+        if reused_result is None:
+            return self._run_timed('natural language', self._cached_nl, test_case)
+        return self._run_timed('natural language', lambda problem: reused_result, test_case, timed=False)
+    
+    def _test_logic_only(self, test_case: Dict[str, Any],
+                         reused_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Test logic reasoning only on a problem, reusing an existing result if given."""
+        if reused_result is None:
+            return self._run_timed('logic reasoning', self._cached_logic, test_case)
+        return self._run_timed('logic reasoning', lambda problem: reused_result, test_case, timed=False)
+    
+    def _run_timed(self, label: str, backend: Callable[[str], Dict[str, Any]], test_case: Dict[str, Any],
+                   extra_fields: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                   error_fields: Mapping[str, Any] = MappingProxyType({}),
+                   timed: bool = True) -> Dict[str, Any]:
+        """
+        Run one reasoning backend on a test problem, timing and scoring the call.
         
-        try:
-            result = self.controller.process_problem(test_case['problem'])
-            
-            processing_time = time.time() - start_time
-            
-            # Evaluate results
-            mode_correct = result.get('mode_selection', {}).get('mode') == test_case['expected_mode']
-            success = result.get('success', False)
-            confidence = result.get('confidence', 0.0)
-            
-            # Simple answer correctness check
-            answer_correct = self._check_answer_correctness(
-                result.get('conclusion', ''),
-                test_case['expected_answer']
-            )
-            
-            return {
-                'success': success,
-                'processing_time': processing_time,
-                'confidence': confidence,
-                'mode_correct': mode_correct,
-                'answer_correct': answer_correct,
-                'conclusion': result.get('conclusion', ''),
-                'mode_selected': result.get('mode_selection', {}).get('mode', 'Unknown')
-            }
+        Trials that only reuse a result computed elsewhere are not timed: their
+        processing_time is NaN, so the summary averages leave them out instead
+        of counting a near-zero lookup as a measurement.
+        
+        Args:
+            label (str): Trial name used in error logs
+            backend (Callable[[str], Dict[str, Any]]): Reasoning call taking the problem text
+            test_case (Dict[str, Any]): Test problem definition
+            extra_fields (Callable, optional): Derives additional trial fields from the backend result
+            error_fields (Mapping[str, Any]): Additional trial fields reported when the backend fails
+            timed (bool): Whether the backend call actually does the reasoning being measured
             
-        except Exception as e:
-            logger.error(f"Error testing dual modality: {e}")
-            return {
-                'success': False,
-                'processing_time': time.time() - start_time,
-                'confidence': 0.0,
-                'mode_correct': False,
-                'answer_correct': False,
-                'conclusion': f"Error: {str(e)}",
-                'mode_selected': 'Error'
-            }
-    
-    def _test_natural_language_only(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
-        """Test natural language reasoning only on a problem."""
-        start_time = time.time()
+        Returns:
+            Dict[str, Any]: Trial result
+        """
+        start_time = time.perf_counter_ns()
         
         try:
-            result = self.nl_reasoner.reason(test_case['problem'], 'general')
+            result = backend(test_case['problem'])
             
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_time) / 1e9 if timed else math.nan
             
+            # Simple answer correctness check
             answer_correct = self._check_answer_correctness(
                 result.get('conclusion', ''),
                 test_case['expected_answer']
             )
             
-            return {
+            trial = {
                 'success': result.get('success', False),
                 'processing_time': processing_time,
                 'confidence': result.get('confidence', 0.0),
                 'answer_correct': answer_correct,
                 'conclusion': result.get('conclusion', '')
             }
+            if extra_fields is not None:
+                trial.update(extra_fields(result))
+            return trial
             
         except Exception as e:
-            logger.error(f"Error testing natural language: {e}")
+            logger.error(f"Error testing {label}: {e}")
             return {
-                'success': False,
-                'processing_time': time.time() - start_time,
-                'confidence': 0.0,
-                'answer_correct': False,
+                **_ERROR_TRIAL,
+                **error_fields,
+                'processing_time': (time.perf_counter_ns() - start_time) / 1e9 if timed else math.nan,
                 'conclusion': f"Error: {str(e)}"
             }
     
-    def _test_logic_only(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
-        """Test logic reasoning only on a problem."""
-        start_time = time.time()
+    def _process_with_controller(self, problem: str) -> Dict[str, Any]:
+        """Run the dual modality controller, throttling concurrent API-backed calls."""
+        # The evaluation already runs problems on its own threads, so each one
+        # makes its NL call itself rather than queueing on the controller's pool
+        with self._api_semaphore:
+            return self.controller.process_problem(problem, inline_nl=True)
+    
+    def _reason_nl(self, problem: str) -> Dict[str, Any]:
+        """Run the NL reasoner on a problem, consulting the persistent cache first."""
+        cached = self._load_cached('nl', problem)
+        if cached is not None:
+            return cached
+        
+        with self._api_semaphore:
+            result = self.nl_reasoner.reason(problem, 'general')
+        
+        self._store_cached('nl', problem, result)
+        return result
+    
+    def _reason_logic(self, problem: str) -> Dict[str, Any]:
+        """Run the logic reasoner on a problem, consulting the persistent cache first."""
+        cached = self._load_cached('logic', problem)
+        if cached is not None:
+            return cached
+        
+        result = self.logic_reasoner.reason(problem)
+        
+        self._store_cached('logic', problem, result)
+        return result
+    
+    def _cache_key(self, kind: str, problem: str) -> str:
+        """
+        Build the persistent cache key for a backend result.
+        
+        The key covers what produced the result: the logic reasoner's code
+        fingerprint, or the NL model (results from the offline fallback are
+        kept apart from API results).
+        """
+        if kind == 'nl':
+            reasoner = self.nl_reasoner
+            version = reasoner.model_name if reasoner.api_available else 'fallback'
+        else:
+            version = reasoner_fingerprint()
+        return hashlib.sha1(f"{kind}:{version}:{problem}".encode('utf-8')).hexdigest()
+    
+    def _load_cached(self, kind: str, problem: str) -> Optional[Dict[str, Any]]:
+        """Load a backend result from the on-disk cache, if enabled."""
+        if not self.cache_dir:
+            return None
         
         try:
-            result = self.logic_reasoner.reason(test_case['problem'])
-            
-            processing_time = time.time() - start_time
-            
-            answer_correct = self._check_answer_correctness(
-                result.get('conclusion', ''),
-                test_case['expected_answer']
-            )
-            
-            return {
-                'success': result.get('success', False),
-                'processing_time': processing_time,
-                'confidence': result.get('confidence', 0.0),
-                'answer_correct': answer_correct,
-                'conclusion': result.get('conclusion', '')
-            }
-            
+            with self._cache_lock, shelve.open(os.path.join(self.cache_dir, 'results')) as cache:
+                return cache.get(self._cache_key(kind, problem))
         except Exception as e:
-            logger.error(f"Error testing logic reasoning: {e}")
-            return {
-                'success': False,
-                'processing_time': time.time() - start_time,
-                'confidence': 0.0,
-                'answer_correct': False,
-                'conclusion': f"Error: {str(e)}"
-            }
+            logger.warning(f"Could not read evaluation cache: {e}")
+            return None
+    
+    def _store_cached(self, kind: str, problem: str, result: Dict[str, Any]):
+        """Persist a successful backend result to the on-disk cache, if enabled."""
+        if not self.cache_dir or not result.get('success', False):
+            return
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with self._cache_lock, shelve.open(os.path.join(self.cache_dir, 'results')) as cache:
+                cache[self._cache_key(kind, problem)] = result
+        except Exception as e:
+            logger.warning(f"Could not write evaluation cache: {e}")
     
     def _check_answer_correctness(self, actual: str, expected: str) -> bool:
         """
@@ -292,21 +545,10 @@ class EvaluationSuite:
         if expected_lower in actual_lower:
             return True
         
-        # Check for semantic equivalents
-        equivalents = {
-            'yes': ['true', 'correct', 'affirmative', 'positive'],
-            'no': ['false', 'incorrect', 'negative'],
-            'true': ['yes', 'correct', 'affirmative'],
-            'false': ['no', 'incorrect', 'negative'],
-            'passed': ['pass', 'success', 'successful'],
-            'weather not nice': ['not nice', 'bad weather', 'poor weather']
-        }
-        
-        for key, values in equivalents.items():
-            if expected_lower == key:
-                return any(val in actual_lower for val in values)
-            elif expected_lower in values:
-                return key in actual_lower or any(val in actual_lower for val in values)
+        # Check for semantic equivalents in a single scan
+        pattern = _EQUIVALENT_PATTERNS.get(expected_lower)
+        if pattern is not None:
+            return pattern.search(actual_lower) is not None
         
         return False
     
@@ -321,183 +563,148 @@ class EvaluationSuite:
         Returns:
             Dict[str, Any]: Summary statistics
         """
+        import pandas as pd
+        
         total_problems = len(results)
         
-        # Dual modality statistics
-        dual_success = sum(1 for r in results if r['dual_modality']['success'])
-        dual_answers_correct = sum(1 for r in results if r['dual_modality']['answer_correct'])
-        dual_modes_correct = sum(1 for r in results if r['dual_modality']['mode_correct'])
-        dual_avg_confidence = sum(r['dual_modality']['confidence'] for r in results) / total_problems
-        dual_avg_time = sum(r['dual_modality']['processing_time'] for r in results) / total_problems
-        
-        # Natural language statistics
-        nl_success = sum(1 for r in results if r['natural_language_only']['success'])
-        nl_answers_correct = sum(1 for r in results if r['natural_language_only']['answer_correct'])
-        nl_avg_confidence = sum(r['natural_language_only']['confidence'] for r in results) / total_problems
-        nl_avg_time = sum(r['natural_language_only']['processing_time'] for r in results) / total_problems
-        
-        # Logic statistics
-        logic_success = sum(1 for r in results if r['logic_only']['success'])
-        logic_answers_correct = sum(1 for r in results if r['logic_only']['answer_correct'])
-        logic_avg_confidence = sum(r['logic_only']['confidence'] for r in results) / total_problems
-        logic_avg_time = sum(r['logic_only']['processing_time'] for r in results) / total_problems
-        
-        # Category-wise performance
-        categories = {}
-        for result in results:
-            category = result['category']
-            if category not in categories:
-                categories[category] = {'total': 0, 'dual_correct': 0, 'nl_correct': 0, 'logic_correct': 0}
-            
-            categories[category]['total'] += 1
-            if result['dual_modality']['answer_correct']:
-                categories[category]['dual_correct'] += 1
-            if result['natural_language_only']['answer_correct']:
-                categories[category]['nl_correct'] += 1
-            if result['logic_only']['answer_correct']:
-                categories[category]['logic_correct'] += 1
-        
-        # Difficulty-wise performance
-        difficulties = {}
-        for result in results:
-            difficulty = result['difficulty']
-            if difficulty not in difficulties:
-                difficulties[difficulty] = {'total': 0, 'dual_correct': 0, 'nl_correct': 0, 'logic_correct': 0}
-            
-            difficulties[difficulty]['total'] += 1
-            if result['dual_modality']['answer_correct']:
-                difficulties[difficulty]['dual_correct'] += 1
-            if result['natural_language_only']['answer_correct']:
-                difficulties[difficulty]['nl_correct'] += 1
-            if result['logic_only']['answer_correct']:
-                difficulties[difficulty]['logic_correct'] += 1
+        # Flatten the per-mode results into columns like 'dual_modality.confidence'.
+        # mean() skips NaN, so untimed (reused) trials drop out of the time averages.
+        df = pd.json_normalize(results)
+        means = df[[
+            'dual_modality.success', 'dual_modality.answer_correct', 'dual_modality.mode_correct',
+            'dual_modality.confidence', 'dual_modality.processing_time',
+            'natural_language_only.success', 'natural_language_only.answer_correct',
+            'natural_language_only.confidence', 'natural_language_only.processing_time',
+            'logic_only.success', 'logic_only.answer_correct',
+            'logic_only.confidence', 'logic_only.processing_time'
+        ]].astype(float).mean()
         
         return {
             'total_problems': total_problems,
             'total_time': total_time,
             'dual_modality': {
-                'success_rate': dual_success / total_problems,
-                'accuracy': dual_answers_correct / total_problems,
-                'mode_selection_accuracy': dual_modes_correct / total_problems,
-                'avg_confidence': dual_avg_confidence,
-                'avg_processing_time': dual_avg_time
+                'success_rate': means['dual_modality.success'],
+                'accuracy': means['dual_modality.answer_correct'],
+                'mode_selection_accuracy': means['dual_modality.mode_correct'],
+                'avg_confidence': means['dual_modality.confidence'],
+                'avg_processing_time': means['dual_modality.processing_time']
             },
             'natural_language': {
-                'success_rate': nl_success / total_problems,
-                'accuracy': nl_answers_correct / total_problems,
-                'avg_confidence': nl_avg_confidence,
-                'avg_processing_time': nl_avg_time
+                'success_rate': means['natural_language_only.success'],
+                'accuracy': means['natural_language_only.answer_correct'],
+                'avg_confidence': means['natural_language_only.confidence'],
+                'avg_processing_time': means['natural_language_only.processing_time']
             },
             'logic_reasoning': {
-                'success_rate': logic_success / total_problems,
-                'accuracy': logic_answers_correct / total_problems,
-                'avg_confidence': logic_avg_confidence,
-                'avg_processing_time': logic_avg_time
+                'success_rate': means['logic_only.success'],
+                'accuracy': means['logic_only.answer_correct'],
+                'avg_confidence': means['logic_only.confidence'],
+                'avg_processing_time': means['logic_only.processing_time']
             },
-            'category_performance': categories,
-            'difficulty_performance': difficulties
+            'category_performance': self._group_performance(df, 'category'),
+            'difficulty_performance': self._group_performance(df, 'difficulty')
         }
     
-    def save_results(self, results: Dict[str, Any], filename: str = None) -> str:
+    def _group_performance(self, df: 'pd.DataFrame', key: str) -> Dict[str, Dict[str, int]]:
+        """
+        Count correct answers per mode for each value of a grouping column.
+        
+        Args:
+            df (pd.DataFrame): Flattened evaluation results
+            key (str): Column to group by ('category' or 'difficulty')
+            
+        Returns:
+            Dict[str, Dict[str, int]]: Totals and correct counts keyed by group
+        """
+        import numpy as np
+        import pandas as pd
+        
+        # Integer-encode the groups (first-appearance order) and tally each column in one pass
+        codes, groups = pd.factorize(df[key])
+        num_groups = len(groups)
+        totals = np.bincount(codes, minlength=num_groups)
+        correct = {
+            name: np.bincount(codes, weights=df[column].astype(np.int8), minlength=num_groups)
+            for name, column in (
+                ('dual_correct', 'dual_modality.answer_correct'),
+                ('nl_correct', 'natural_language_only.answer_correct'),
+                ('logic_correct', 'logic_only.answer_correct')
+            )
+        }
+        
+        return {
+            group: {
+                'total': int(totals[i]),
+                **{name: int(counts[i]) for name, counts in correct.items()}
+            }
+            for i, group in enumerate(groups)
+        }
+    
+    def save_results(self, results: Dict[str, Any], filename: str = None, include_detailed: bool = True,
+                     parquet: bool = False) -> str:
         """
         Save evaluation results to CSV files.
         
         Args:
             results (Dict[str, Any]): Evaluation results
             filename (str, optional): Base filename for output files
+            include_detailed (bool): Write the detailed CSV; pass False when it was
+                already streamed through a DetailedCSVWriter
+            parquet (bool): Also write Parquet copies of the detailed and summary
+                tables for fast loading with pd.read_parquet (requires pyarrow)
             
         Returns:
             str: Path to saved files
         """
+        import pandas as pd
+        
         if filename is None:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"evaluation_results_{timestamp}"
         
         # Save detailed results
-        detailed_data = []
-        for result in results['detailed_results']:
-            row = {
-                'problem_id': result['problem_id'],
-                'problem': result['problem'],
-                'category': result['category'],
-                'difficulty': result['difficulty'],
-                'expected_mode': result['expected_mode'],
-                'expected_answer': result['expected_answer'],
-                'dual_success': result['dual_modality']['success'],
-                'dual_answer_correct': result['dual_modality']['answer_correct'],
-                'dual_mode_correct': result['dual_modality']['mode_correct'],
-                'dual_confidence': result['dual_modality']['confidence'],
-                'dual_time': result['dual_modality']['processing_time'],
-                'dual_conclusion': result['dual_modality']['conclusion'],
-                'dual_mode_selected': result['dual_modality']['mode_selected'],
-                'nl_success': result['natural_language_only']['success'],
-                'nl_answer_correct': result['natural_language_only']['answer_correct'],
-                'nl_confidence': result['natural_language_only']['confidence'],
-                'nl_time': result['natural_language_only']['processing_time'],
-                'nl_conclusion': result['natural_language_only']['conclusion'],
-                'logic_success': result['logic_only']['success'],
-                'logic_answer_correct': result['logic_only']['answer_correct'],
-                'logic_confidence': result['logic_only']['confidence'],
-                'logic_time': result['logic_only']['processing_time'],
-                'logic_conclusion': result['logic_only']['conclusion']
-            }
-            detailed_data.append(row)
-        
-        detailed_df = pd.DataFrame(detailed_data)
         detailed_filename = f"{filename}_detailed.csv"
-        detailed_df.to_csv(detailed_filename, index=False)
+        if include_detailed or parquet:
+            detailed_df = pd.DataFrame.from_records(
+                [astuple(EvalRow.from_result(result)) for result in results['detailed_results']],
+                columns=EVAL_ROW_COLUMNS
+            )
+            if include_detailed:
+                detailed_df.to_csv(detailed_filename, index=False)
+            if parquet:
+                detailed_df.to_parquet(f"{filename}_detailed.parquet", index=False)
         
-        # Save summary statistics
-        summary_data = []
+        # Save summary statistics as (category, metric, value) records
         summary = results['summary']
+        overall_stats = (
+            ('overall', 'dual_modality_accuracy', summary['dual_modality']['accuracy']),
+            ('overall', 'dual_modality_mode_accuracy', summary['dual_modality']['mode_selection_accuracy']),
+            ('overall', 'natural_language_accuracy', summary['natural_language']['accuracy']),
+            ('overall', 'logic_reasoning_accuracy', summary['logic_reasoning']['accuracy'])
+        )
+        category_stats = (
+            (category, metric, perf[correct_key] / perf['total'])
+            for category, perf in summary['category_performance'].items() if perf['total'] > 0
+            for metric, correct_key in (
+                ('dual_modality_accuracy', 'dual_correct'),
+                ('natural_language_accuracy', 'nl_correct'),
+                ('logic_reasoning_accuracy', 'logic_correct')
+            )
+        )
+        categories, metrics, values = zip(*itertools.chain(overall_stats, category_stats))
         
-        # Overall statistics
-        summary_data.append({
-            'metric': 'dual_modality_accuracy',
-            'value': summary['dual_modality']['accuracy'],
-            'category': 'overall'
-        })
-        summary_data.append({
-            'metric': 'dual_modality_mode_accuracy',
-            'value': summary['dual_modality']['mode_selection_accuracy'],
-            'category': 'overall'
+        summary_df = pd.DataFrame({
+            'metric': pd.Categorical(metrics, categories=SUMMARY_METRICS),
+            'value': values,
+            'category': pd.Categorical(categories, categories=['overall', *summary['category_performance']])
         })
-        summary_data.append({
-            'metric': 'natural_language_accuracy',
-            'value': summary['natural_language']['accuracy'],
-            'category': 'overall'
-        })
-        summary_data.append({
-            'metric': 'logic_reasoning_accuracy',
-            'value': summary['logic_reasoning']['accuracy'],
-            'category': 'overall'
-        })
-        
-        # Category-wise statistics
-        for category, perf in summary['category_performance'].items():
-            if perf['total'] > 0:
-                summary_data.append({
-                    'metric': 'dual_modality_accuracy',
-                    'value': perf['dual_correct'] / perf['total'],
-                    'category': category
-                })
-                summary_data.append({
-                    'metric': 'natural_language_accuracy',
-                    'value': perf['nl_correct'] / perf['total'],
-                    'category': category
-                })
-                summary_data.append({
-                    'metric': 'logic_reasoning_accuracy',
-                    'value': perf['logic_correct'] / perf['total'],
-                    'category': category
-                })
-        
-        summary_df = pd.DataFrame(summary_data)
         summary_filename = f"{filename}_summary.csv"
         summary_df.to_csv(summary_filename, index=False)
+        if parquet:
+            summary_df.to_parquet(f"{filename}_summary.parquet", index=False)
         
         logger.info(f"Results saved to {detailed_filename} and {summary_filename}")
-        return f"{filename}_*.csv"
+        return f"{filename}_*" if parquet else f"{filename}_*.csv"
 
 def run_evaluation(api_key: str = None) -> Dict[str, Any]:
     """
@@ -510,11 +717,14 @@ def run_evaluation(api_key: str = None) -> Dict[str, Any]:
         Dict[str, Any]: Evaluation results
     """
     evaluator = EvaluationSuite(api_key)
-    results = evaluator.run_full_evaluation()
+    filename = f"evaluation_results_{time.strftime('%Y%m%d_%H%M%S')}"
+    
+    # Detailed rows are written as each problem finishes
+    with DetailedCSVWriter(f"{filename}_detailed.csv") as sink:
+        results = evaluator.run_full_evaluation(sink=sink)
     
-    # Save results
-    filename = evaluator.save_results(results)
-    results['saved_files'] = filename
+    # Save summary results
+    results['saved_files'] = evaluator.save_results(results, filename, include_detailed=False)
     
     return results
 
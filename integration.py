@@ -3,31 +3,195 @@ Integration Controller for Dual Modality Reasoning Agent
 Coordinates between natural language and logic reasoning modules
 """
 
+import re
+import copy
+import functools
 import logging
-from typing import Dict, Any, Optional, Tuple
-from natural_language import NaturalLanguageReasoner
-from logic_reasoning import LogicReasoner
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+from logic_reasoning import get_logic_reasoner
 from utils import (
+    MODE_DUAL,
+    MODE_LOGIC_ONLY,
+    MODE_NL_ONLY,
+    LogicFeatures,
+    detect_logical_flags,
     detect_logical_keywords, 
     calculate_confidence_score, 
     format_reasoning_output,
     validate_input
 )
 
+if TYPE_CHECKING:
+    from natural_language import NaturalLanguageReasoner
+
 logger = logging.getLogger(__name__)
 
+# Keyword tables used by the mode-selection heuristics
+_LOGIC_SYMBOL_RE = re.compile('[→∧∨¬≡]')  # subset of the formal_logic symbols in utils
+_PROOF_WORDS = frozenset({'prove', 'show'})
+_NARRATIVE_RE = re.compile(r'\b(?:john|mary|student|teacher|person)s?\b')
+
+# Verdict words compared when checking whether both modes agree
+_AGREE_RE = re.compile(r'\b(true|false|yes|no|correct|incorrect)\b')
+_POSITIVE = frozenset({'true', 'yes', 'correct'})
+
+# Mode selection rules, checked in order: (logic threshold key, NL threshold key
+# or None, mode, explanation). The first rule whose thresholds are met wins.
+_MODE_RULES = (
+    ('logic_strong', None, MODE_LOGIC_ONLY,
+     "High confidence in logical structure detected. Using formal logic reasoning."),
+    ('dual_mode', 'dual_mode', MODE_DUAL,
+     "Both logical structure and natural language patterns detected. Using both reasoning approaches."),
+    ('nl_only', None, MODE_DUAL,
+     "Some logical elements detected. Using dual mode for comprehensive analysis."),
+)
+_DEFAULT_MODE = (MODE_NL_ONLY, "No clear logical structure detected. Using natural language reasoning.")
+
+def _logic_confidence_score(features: LogicFeatures, proof: bool, symbols: bool) -> float:
+    """
+    Score how strongly a problem calls for logic reasoning.
+    
+    Args:
+        features (LogicFeatures): Detected logical features
+        proof (bool): Whether the problem asks to prove or show something
+        symbols (bool): Whether the problem uses propositional symbols
+        
+    Returns:
+        float: Logic confidence score
+    """
+    confidence = 0.0
+    
+    # Formal logic symbols
+    if features & LogicFeatures.FORMAL_LOGIC:
+        confidence += 0.4
+    
+    # Logical connectives
+    if features & LogicFeatures.LOGICAL_CONNECTIVES:
+        confidence += 0.3
+    
+    # Conditional statements
+    if features & LogicFeatures.CONDITIONALS:
+        confidence += 0.2
+    
+    # Quantifiers (lower weight for propositional logic)
+    if features & LogicFeatures.QUANTIFIERS:
+        confidence += 0.1
+    
+    if proof:
+        confidence += 0.2
+    
+    if symbols:
+        confidence += 0.3
+    
+    return min(1.0, confidence)
+
+def _nl_confidence_score(features: LogicFeatures, long_problem: bool, narrative: bool) -> float:
+    """
+    Score how strongly a problem calls for natural language reasoning.
+    
+    Args:
+        features (LogicFeatures): Detected logical features
+        long_problem (bool): Whether the problem has more than ten words
+        narrative (bool): Whether the problem mentions people or characters
+        
+    Returns:
+        float: Natural language confidence score
+    """
+    confidence = 0.5  # Base confidence for NL reasoning
+    
+    # Questions indicate NL reasoning is appropriate
+    if features & LogicFeatures.QUESTIONS:
+        confidence += 0.3
+    
+    if long_problem:
+        confidence += 0.1
+    
+    if narrative:
+        confidence += 0.2
+    
+    # Decrease confidence if too much formal logic
+    if features & LogicFeatures.FORMAL_LOGIC:
+        confidence -= 0.2
+    
+    return max(0.0, min(1.0, confidence))
+
+# Every confidence score the heuristics can produce, indexed by the feature
+# bitmask shifted left by two with the two text-derived flags in the low bits
+_FEATURE_COMBINATIONS = range(1 << len(LogicFeatures))
+_LOGIC_CONFIDENCE = tuple(
+    _logic_confidence_score(LogicFeatures(mask), bool(index & 2), bool(index & 1))
+    for mask in _FEATURE_COMBINATIONS for index in range(4)
+)
+_NL_CONFIDENCE = tuple(
+    _nl_confidence_score(LogicFeatures(mask), bool(index & 2), bool(index & 1))
+    for mask in _FEATURE_COMBINATIONS for index in range(4)
+)
+
+# Threads that overlap dual-mode NL calls with local logic reasoning. The pool
+# is shared by every controller and never shut down by one of them; callers
+# that are already concurrent make their NL calls inline instead
+NL_POOL_WORKERS = 8
+
+@functools.lru_cache(maxsize=None)
+def _get_nl_pool() -> ThreadPoolExecutor:
+    """Get the thread pool that runs background NL calls for all controllers."""
+    return ThreadPoolExecutor(max_workers=NL_POOL_WORKERS, thread_name_prefix='dual-mode')
+
+def is_cacheable_result(result: Dict[str, Any]) -> bool:
+    """
+    Check whether a processing result is safe to reuse for the same problem.
+    
+    Only results where every reasoner that ran succeeded qualify, so transient
+    API failures are retried on the next call.
+    
+    Args:
+        result (Dict[str, Any]): Result from process_problem
+        
+    Returns:
+        bool: True if the result may be cached
+    """
+    if not result.get('success'):
+        return False
+    for part in (result.get('natural_language'), result.get('logic_reasoning')):
+        if part is not None and not part.get('success'):
+            return False
+    return True
+
 class DualModalityController:
-    """Main controller that integrates natural language and logic reasoning."""
+    """
+    Main controller that integrates natural language and logic reasoning.
+    
+    Instances use __slots__; subclasses that need extra attributes should
+    declare their own __slots__ (or add '__dict__' to them).
+    """
+    
+    __slots__ = (
+        '_api_key', '_nl_reasoner', '_nl_lock', 'logic_reasoner',
+        'cache_size', '_cache', '_cache_lock', '_nl_cache', 'thresholds'
+    )
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_size: int = 256):
         """
         Initialize the dual modality controller.
         
         Args:
             api_key (str, optional): Google AI API key for natural language reasoning
+            cache_size (int): Number of recent problem results to keep in memory
         """
-        self.nl_reasoner = NaturalLanguageReasoner(api_key)
-        self.logic_reasoner = LogicReasoner()
+        # The NL reasoner is built on first use so logic-only work never loads it
+        self._api_key = api_key
+        self._nl_reasoner: Optional['NaturalLanguageReasoner'] = None
+        self._nl_lock = threading.Lock()
+        self.logic_reasoner = get_logic_reasoner()
+        
+        # Recently processed problems, most recently used last
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._nl_cache: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
         
         # Mode selection thresholds
         self.thresholds = {
@@ -36,12 +200,93 @@ class DualModalityController:
             'nl_only': 0.3          # Low confidence for NL-only mode
         }
     
-    def process_problem(self, problem: str) -> Dict[str, Any]:
+    @property
+    def nl_reasoner(self) -> 'NaturalLanguageReasoner':
+        """Natural language reasoner, created the first time it is needed."""
+        if self._nl_reasoner is None:
+            with self._nl_lock:
+                if self._nl_reasoner is None:
+                    from natural_language import NaturalLanguageReasoner
+                    self._nl_reasoner = NaturalLanguageReasoner(self._api_key)
+        return self._nl_reasoner
+    
+    def clear_cache(self):
+        """Forget all cached problem and natural language results."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._nl_cache.clear()
+    
+    def _reason_nl(self, problem: str, reasoning_type: str) -> Dict[str, Any]:
+        """
+        Run the natural language reasoner, reusing earlier successful answers.
+        
+        Args:
+            problem (str): Problem to analyze
+            reasoning_type (str): Prompt kind passed to the reasoner
+            
+        Returns:
+            Dict[str, Any]: Natural language reasoning result
+        """
+        key = (problem, reasoning_type)
+        with self._cache_lock:
+            cached = self._nl_cache.get(key)
+            if cached is not None:
+                self._nl_cache.move_to_end(key)
+                return dict(cached)
+        
+        result = self.nl_reasoner.reason(problem, reasoning_type)
+        if self.cache_size > 0 and result.get('success'):
+            with self._cache_lock:
+                self._nl_cache[key] = dict(result)
+                while len(self._nl_cache) > self.cache_size:
+                    self._nl_cache.popitem(last=False)
+        return result
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result, marking it as recently used.
+        
+        Args:
+            key (str): Normalized problem text
+            
+        Returns:
+            Optional[Dict[str, Any]]: Copy of the cached result, or None on a miss
+        """
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                return None
+            self._cache.move_to_end(key)
+        return copy.deepcopy(result)
+    
+    def _cache_put(self, key: str, result: Dict[str, Any]):
+        """
+        Store a result, evicting the least recently used entry when full.
+        
+        Only results where every reasoner that ran succeeded are kept, so
+        transient API failures are retried on the next call.
+        
+        Args:
+            key (str): Normalized problem text
+            result (Dict[str, Any]): Result from process_problem
+        """
+        if self.cache_size <= 0 or not is_cacheable_result(result):
+            return
+        entry = copy.deepcopy(result)
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def process_problem(self, problem: str, inline_nl: bool = False) -> Dict[str, Any]:
         """
         Process a problem using the dual modality reasoning system.
         
         Args:
             problem (str): The problem to analyze
+            inline_nl (bool): Make dual mode NL calls on the calling thread; set
+                this when the caller already runs problems concurrently
             
         Returns:
             Dict[str, Any]: Complete reasoning result
@@ -54,62 +299,150 @@ class DualModalityController:
                 'success': False
             }
         
+        cache_key = problem.strip()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        return self._execute(problem, cache_key, inline_nl=inline_nl)
+    
+    def process_problems(self, problems: List[str], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Process several problems, overlapping their natural language API calls.
+        
+        Logic-only problems are solved inline since they are CPU-bound; problems
+        that need the natural language reasoner run on a bounded thread pool.
+        Identical problems in the batch are only solved once.
+        
+        Args:
+            problems (List[str]): Problems to analyze
+            max_workers (int): Maximum number of concurrent API-bound problems
+            
+        Returns:
+            List[Dict[str, Any]]: One result per problem, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(problems)
+        pending: Dict[str, List[int]] = {}
+        
+        for index, problem in enumerate(problems):
+            validation = validate_input(problem)
+            if not validation['valid']:
+                results[index] = {'error': validation['error'], 'success': False}
+                continue
+            cache_key = problem.strip()
+            if cache_key in pending:
+                pending[cache_key].append(index)
+                continue
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                results[index] = cached
+                continue
+            pending[cache_key] = [index]
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {}
+            for cache_key, indices in pending.items():
+                problem = problems[indices[0]]
+                try:
+                    mode_selection = self._select_reasoning_mode(problem, problem.lower())
+                except Exception as e:
+                    results[indices[0]] = self._error_result(e)
+                    continue
+                if mode_selection['mode'] == MODE_LOGIC_ONLY:
+                    results[indices[0]] = self._execute(problem, cache_key, mode_selection)
+                else:
+                    # The batch worker is already off the caller's thread, so it
+                    # makes its NL call itself instead of queueing on the shared pool
+                    futures[cache_key] = pool.submit(self._execute, problem, cache_key, mode_selection,
+                                                     inline_nl=True)
+            for cache_key, future in futures.items():
+                results[pending[cache_key][0]] = future.result()
+        
+        # Duplicates get their own copy so callers can mutate results freely
+        for indices in pending.values():
+            first = results[indices[0]]
+            for index in indices[1:]:
+                results[index] = copy.deepcopy(first)
+        
+        return results
+    
+    def _execute(self, problem: str, cache_key: str,
+                 mode_selection: Optional[Dict[str, Any]] = None,
+                 inline_nl: bool = False) -> Dict[str, Any]:
+        """
+        Run the selected reasoning mode(s) for a validated problem.
+        
+        Args:
+            problem (str): The problem to analyze
+            cache_key (str): Normalized problem text used for the result cache
+            mode_selection (Dict[str, Any], optional): Precomputed mode selection
+            inline_nl (bool): Make dual mode NL calls on the calling thread
+            
+        Returns:
+            Dict[str, Any]: Complete reasoning result
+        """
         try:
             # Analyze problem to determine reasoning approach
-            mode_selection = self._select_reasoning_mode(problem)
+            if mode_selection is None:
+                mode_selection = self._select_reasoning_mode(problem, problem.lower())
             
             # Execute reasoning based on selected mode
-            if mode_selection['mode'] == 'Natural Language Only':
-                result = self._process_nl_only(problem)
-            elif mode_selection['mode'] == 'Logic Only':
-                result = self._process_logic_only(problem)
+            if mode_selection['mode'] == MODE_NL_ONLY:
+                result = self._process_nl_only(problem, mode_selection)
+            elif mode_selection['mode'] == MODE_LOGIC_ONLY:
+                result = self._process_logic_only(problem, mode_selection)
             else:  # Dual Mode
-                result = self._process_dual_mode(problem)
-            
-            # Add mode selection information
-            result['mode_selection'] = mode_selection
-            result['success'] = True
+                result = self._process_dual_mode(problem, mode_selection, inline_nl)
             
+            self._cache_put(cache_key, result)
             return result
             
         except Exception as e:
-            logger.error(f"Error processing problem: {e}")
-            return {
-                'error': f"Error processing problem: {str(e)}",
-                'success': False
-            }
+            return self._error_result(e)
     
-    def _select_reasoning_mode(self, problem: str) -> Dict[str, Any]:
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """
+        Log a processing failure and build the corresponding result.
+        
+        Args:
+            error (Exception): The exception raised while processing
+            
+        Returns:
+            Dict[str, Any]: Failed result with error message
+        """
+        logger.error("Error processing problem: %s", error)
+        return {
+            'error': f"Error processing problem: {str(error)}",
+            'success': False
+        }
+    
+    def _select_reasoning_mode(self, problem: str, problem_lower: str) -> Dict[str, Any]:
         """
         Select the appropriate reasoning mode based on problem analysis.
         
         Args:
             problem (str): Problem to analyze
+            problem_lower (str): Lowercased problem text
             
         Returns:
             Dict[str, Any]: Mode selection with explanation
         """
         # Detect logical keywords and patterns
-        logical_features = detect_logical_keywords(problem)
+        logical_features = detect_logical_keywords(problem, problem_lower)
+        flags = detect_logical_flags(problem, problem_lower)
         
         # Calculate mode confidence scores
-        logic_confidence = self._calculate_logic_confidence(logical_features, problem)
-        nl_confidence = self._calculate_nl_confidence(logical_features, problem)
+        logic_confidence = self._calculate_logic_confidence(flags, problem_lower, problem)
+        nl_confidence = self._calculate_nl_confidence(flags, problem_lower)
         
         # Determine mode based on confidence scores and thresholds
-        if logic_confidence >= self.thresholds['logic_strong']:
-            mode = 'Logic Only'
-            explanation = "High confidence in logical structure detected. Using formal logic reasoning."
-        elif (logic_confidence >= self.thresholds['dual_mode'] and 
-              nl_confidence >= self.thresholds['dual_mode']):
-            mode = 'Dual Mode'
-            explanation = "Both logical structure and natural language patterns detected. Using both reasoning approaches."
-        elif logic_confidence >= self.thresholds['nl_only']:
-            mode = 'Dual Mode'
-            explanation = "Some logical elements detected. Using dual mode for comprehensive analysis."
-        else:
-            mode = 'Natural Language Only'
-            explanation = "No clear logical structure detected. Using natural language reasoning."
+        thresholds = self.thresholds
+        mode, explanation = _DEFAULT_MODE
+        for logic_key, nl_key, rule_mode, rule_explanation in _MODE_RULES:
+            if logic_confidence >= thresholds[logic_key] and (
+                    nl_key is None or nl_confidence >= thresholds[nl_key]):
+                mode, explanation = rule_mode, rule_explanation
+                break
         
         return {
             'mode': mode,
@@ -119,102 +452,76 @@ class DualModalityController:
             'features': logical_features
         }
     
-    def _calculate_logic_confidence(self, features: Dict[str, bool], problem: str) -> float:
+    def _calculate_logic_confidence(self, features: LogicFeatures, problem_lower: str, problem: str) -> float:
         """
         Calculate confidence score for using logic reasoning.
         
         Args:
-            features (Dict[str, bool]): Detected logical features
+            features (LogicFeatures): Detected logical features
+            problem_lower (str): Lowercased problem text
             problem (str): Problem text
             
         Returns:
             float: Logic confidence score
         """
-        confidence = 0.0
-        
-        # Formal logic symbols
-        if features['formal_logic']:
-            confidence += 0.4
-        
-        # Logical connectives
-        if features['logical_connectives']:
-            confidence += 0.3
-        
-        # Conditional statements
-        if features['conditionals']:
-            confidence += 0.2
-        
-        # Quantifiers (lower weight for propositional logic)
-        if features['quantifiers']:
-            confidence += 0.1
-        
         # Check for specific logical patterns
-        if 'prove' in problem.lower() or 'show' in problem.lower():
-            confidence += 0.2
+        proof = any(word in problem_lower for word in _PROOF_WORDS)
         
-        if any(symbol in problem for symbol in ['→', '∧', '∨', '¬', '≡']):
-            confidence += 0.3
+        # Only rescan for symbols when keyword detection already saw one
+        symbols = bool(features & LogicFeatures.FORMAL_LOGIC) and _LOGIC_SYMBOL_RE.search(problem) is not None
         
-        return min(1.0, confidence)
+        return _LOGIC_CONFIDENCE[int(features) << 2 | proof << 1 | symbols]
     
-    def _calculate_nl_confidence(self, features: Dict[str, bool], problem: str) -> float:
+    def _calculate_nl_confidence(self, features: LogicFeatures, problem_lower: str) -> float:
         """
         Calculate confidence score for using natural language reasoning.
         
         Args:
-            features (Dict[str, bool]): Detected logical features
-            problem (str): Problem text
+            features (LogicFeatures): Detected logical features
+            problem_lower (str): Lowercased problem text
             
         Returns:
             float: Natural language confidence score
         """
-        confidence = 0.5  # Base confidence for NL reasoning
-        
-        # Questions indicate NL reasoning is appropriate
-        if features['questions']:
-            confidence += 0.3
-        
         # Complex language patterns
-        if len(problem.split()) > 10:
-            confidence += 0.1
+        long_problem = len(problem_lower.split()) > 10
         
         # Narrative elements
-        if any(word in problem.lower() for word in ['john', 'mary', 'student', 'teacher', 'person']):
-            confidence += 0.2
-        
-        # Decrease confidence if too much formal logic
-        if features['formal_logic']:
-            confidence -= 0.2
+        narrative = _NARRATIVE_RE.search(problem_lower) is not None
         
-        return max(0.0, min(1.0, confidence))
+        return _NL_CONFIDENCE[int(features) << 2 | long_problem << 1 | narrative]
     
-    def _process_nl_only(self, problem: str) -> Dict[str, Any]:
+    def _process_nl_only(self, problem: str, mode_selection: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process problem using only natural language reasoning.
         
         Args:
             problem (str): Problem to analyze
+            mode_selection (Dict[str, Any]): Mode selection that chose this path
             
         Returns:
             Dict[str, Any]: Natural language reasoning result
         """
-        nl_result = self.nl_reasoner.reason(problem, 'general')
+        nl_result = self._reason_nl(problem, 'general')
         
         return {
-            'mode': 'Natural Language Only',
+            'mode': MODE_NL_ONLY,
             'natural_language': nl_result,
             'logic_reasoning': None,
             'combined_result': nl_result['result'],
             'confidence': nl_result['confidence'],
-            'conclusion': nl_result['conclusion']
+            'conclusion': nl_result['conclusion'],
+            'mode_selection': mode_selection,
+            'success': True
         }
     
-    def _process_logic_only(self, problem: str) -> Dict[str, Any]:
+    def _process_logic_only(self, problem: str, mode_selection: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process problem using only logic reasoning.
         
         Args:
             problem (str): Problem to analyze
+            mode_selection (Dict[str, Any]): Mode selection that chose this path
             
         Returns:
             Dict[str, Any]: Logic reasoning result
@@ -222,80 +529,92 @@ class DualModalityController:
         logic_result = self.logic_reasoner.reason(problem)
         
         return {
-            'mode': 'Logic Only',
+            'mode': MODE_LOGIC_ONLY,
             'natural_language': None,
             'logic_reasoning': logic_result,
             'combined_result': logic_result['result'],
             'confidence': logic_result['confidence'],
-            'conclusion': logic_result['conclusion']
+            'conclusion': logic_result['conclusion'],
+            'mode_selection': mode_selection,
+            'success': True
         }
     
-    def _process_dual_mode(self, problem: str) -> Dict[str, Any]:
+    def _process_dual_mode(self, problem: str, mode_selection: Dict[str, Any],
+                           inline_nl: bool = False) -> Dict[str, Any]:
         """
         Process problem using both natural language and logic reasoning.
         
         Args:
             problem (str): Problem to analyze
+            mode_selection (Dict[str, Any]): Mode selection that chose this path
+            inline_nl (bool): Make the NL call on this thread instead of the
+                shared background pool (used by concurrent callers)
             
         Returns:
             Dict[str, Any]: Combined reasoning result
         """
-        # Run both reasoning modes
-        nl_result = self.nl_reasoner.reason(problem, 'logical')
-        logic_result = self.logic_reasoner.reason(problem)
+        if inline_nl:
+            logic_result = self.logic_reasoner.reason(problem)
+            nl_result = self._reason_nl(problem, 'logical')
+        else:
+            # Run both reasoning modes; the NL call is network-bound, so it runs in
+            # the background while logic reasoning proceeds on this thread
+            nl_future = _get_nl_pool().submit(self._reason_nl, problem, 'logical')
+            logic_result = self.logic_reasoner.reason(problem)
+            nl_result = nl_future.result()
+        
+        # Lowercase each successful conclusion once for the agreement check
+        nl_lower = nl_result['conclusion'].lower() if nl_result['success'] else None
+        logic_lower = logic_result['conclusion'].lower() if logic_result['success'] else None
         
         # Check for agreement between modes
-        mode_agreement = self._check_mode_agreement(nl_result, logic_result)
+        mode_agreement = self._check_mode_agreement(nl_lower, logic_lower)
         
         # Calculate combined confidence
         combined_confidence = calculate_confidence_score(
             nl_result['result'] if nl_result['success'] else '',
             logic_result['result'] if logic_result['success'] else '',
             mode_agreement,
-            nl_result['success'] and logic_result['success']
+            nl_lower is not None and logic_lower is not None
         )
         
         # Generate combined result
         combined_result = self._combine_results(nl_result, logic_result, mode_agreement)
         
         return {
-            'mode': 'Dual Mode',
+            'mode': MODE_DUAL,
             'natural_language': nl_result,
             'logic_reasoning': logic_result,
             'combined_result': combined_result,
             'confidence': combined_confidence,
             'conclusion': self._generate_dual_conclusion(nl_result, logic_result, mode_agreement),
-            'mode_agreement': mode_agreement
+            'mode_agreement': mode_agreement,
+            'mode_selection': mode_selection,
+            'success': True
         }
     
-    def _check_mode_agreement(self, nl_result: Dict[str, Any], logic_result: Dict[str, Any]) -> bool:
+    def _check_mode_agreement(self, nl_conclusion: Optional[str], logic_conclusion: Optional[str]) -> bool:
         """
         Check if the two reasoning modes agree on the conclusion.
         
         Args:
-            nl_result (Dict[str, Any]): Natural language result
-            logic_result (Dict[str, Any]): Logic reasoning result
+            nl_conclusion (str, optional): Lowercased NL conclusion, None if NL reasoning failed
+            logic_conclusion (str, optional): Lowercased logic conclusion, None if logic reasoning failed
             
         Returns:
             bool: True if modes agree, False otherwise
         """
-        if not nl_result['success'] or not logic_result['success']:
+        if nl_conclusion is None or logic_conclusion is None:
             return False
         
-        nl_conclusion = nl_result['conclusion'].lower()
-        logic_conclusion = logic_result['conclusion'].lower()
-        
-        # Simple agreement check based on keywords
-        agreement_indicators = ['true', 'false', 'yes', 'no', 'correct', 'incorrect']
+        # Simple agreement check based on verdict keywords
+        nl_hits = set(_AGREE_RE.findall(nl_conclusion))
+        logic_hits = set(_AGREE_RE.findall(logic_conclusion))
         
-        nl_has_indicator = any(indicator in nl_conclusion for indicator in agreement_indicators)
-        logic_has_indicator = any(indicator in logic_conclusion for indicator in agreement_indicators)
-        
-        if nl_has_indicator and logic_has_indicator:
+        if nl_hits and logic_hits:
             # Check if they have the same polarity
-            positive_indicators = ['true', 'yes', 'correct']
-            nl_positive = any(indicator in nl_conclusion for indicator in positive_indicators)
-            logic_positive = any(indicator in logic_conclusion for indicator in positive_indicators)
+            nl_positive = not _POSITIVE.isdisjoint(nl_hits)
+            logic_positive = not _POSITIVE.isdisjoint(logic_hits)
             return nl_positive == logic_positive
         
         # If no clear indicators, assume agreement if both succeeded
@@ -313,39 +632,38 @@ class DualModalityController:
         Returns:
             str: Combined result text
         """
-        combined = "Dual Modality Analysis:\n\n"
+        parts = ["Dual Modality Analysis:", ""]
         
         # Natural language reasoning section
         if nl_result['success']:
-            combined += "Natural Language Reasoning:\n"
-            combined += nl_result['result'] + "\n\n"
+            parts.extend(("Natural Language Reasoning:", nl_result['result'], ""))
         
         # Logic reasoning section
         if logic_result['success']:
-            combined += "Logic Reasoning:\n"
-            combined += logic_result['result'] + "\n\n"
+            parts.extend(("Logic Reasoning:", logic_result['result'], ""))
         
         # Agreement analysis
         if agreement:
-            combined += "The two reasoning approaches agree on the conclusion.\n"
+            parts.append("The two reasoning approaches agree on the conclusion.")
         else:
-            combined += "The two reasoning approaches show different perspectives.\n"
+            parts.append("The two reasoning approaches show different perspectives.")
+        parts.append("")
         
         # Final conclusion
         if nl_result['success'] and logic_result['success']:
             if agreement:
-                combined += f"\nFinal Conclusion: {nl_result['conclusion']}"
+                parts.append(f"Final Conclusion: {nl_result['conclusion']}")
             else:
-                combined += f"\nNatural Language Conclusion: {nl_result['conclusion']}\n"
-                combined += f"Logic Conclusion: {logic_result['conclusion']}"
+                parts.append(f"Natural Language Conclusion: {nl_result['conclusion']}")
+                parts.append(f"Logic Conclusion: {logic_result['conclusion']}")
         elif nl_result['success']:
-            combined += f"\nFinal Conclusion: {nl_result['conclusion']}"
+            parts.append(f"Final Conclusion: {nl_result['conclusion']}")
         elif logic_result['success']:
-            combined += f"\nFinal Conclusion: {logic_result['conclusion']}"
+            parts.append(f"Final Conclusion: {logic_result['conclusion']}")
         else:
-            combined += "\nUnable to reach a definitive conclusion through either reasoning approach."
+            parts.append("Unable to reach a definitive conclusion through either reasoning approach.")
         
-        return combined
+        return "\n".join(parts)
     
     def _generate_dual_conclusion(self, nl_result: Dict[str, Any], logic_result: Dict[str, Any], agreement: bool) -> str:
         """
@@ -369,9 +687,13 @@ class DualModalityController:
         
         return "Unable to determine conclusion"
 
+@functools.lru_cache(maxsize=None)
 def get_dual_modality_controller(api_key: Optional[str] = None) -> DualModalityController:
     """
-    Factory function to create a dual modality controller.
+    Get the process-wide dual modality controller for an API key.
+    
+    Callers share the controller, its worker thread and its result cache;
+    construct DualModalityController directly for a private one.
     
     Args:
         api_key (str, optional): Google AI API key
@@ -381,3 +703,20 @@ def get_dual_modality_controller(api_key: Optional[str] = None) -> DualModalityC
     """
     return DualModalityController(api_key)
 
+def process_problem_in_worker(problem: str, api_key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Process a problem with a controller owned by the calling process.
+    
+    A module-level entry point for process pools: controllers hold locks and a
+    thread pool and cannot be pickled, so each worker process builds its own on
+    first use (see get_dual_modality_controller) and keeps it, and its result
+    cache, for later problems.
+    
+    Args:
+        problem (str): The problem to solve
+        api_key (str, optional): Google AI API key
+        
+    Returns:
+        Dict[str, Any]: Processing result
+    """
+    return get_dual_modality_controller(api_key).process_problem(problem)
@@ -3,39 +3,498 @@ Logic Reasoning Module for Dual Modality Reasoning Agent
 Uses SymPy for symbolic logic and truth table generation
 """
 
+import os
 import re
+import sys
+import copy
+import json
+import string
+import hashlib
 import logging
-from typing import Dict, Any, List, Tuple, Optional
-from sympy import symbols, Implies, And, Or, Not, Equivalent, satisfiable
-from sympy.logic import simplify_logic
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from types import MappingProxyType
+import numpy as np
+import sympy
+from typing import Dict, Any, List, Mapping, Tuple, Optional, Callable, ClassVar, Union, TYPE_CHECKING
+from sympy import symbols, lambdify, Implies, And, Or, Not, Equivalent, satisfiable
 from sympy.logic.boolalg import BooleanFunction
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Largest number of variables a truth table is generated for (2**20 rows)
+MAX_TRUTH_TABLE_VARIABLES = 20
+# Statements with more variables than this are reported without a truth table
+MAX_DISPLAY_TRUTH_TABLE_VARIABLES = 8
+# Number of problem results and parsed statements each reasoner keeps in memory
+RESULT_CACHE_SIZE = 1024
+PARSE_CACHE_SIZE = 512
+
+# Formal statement patterns, tried in order. The parenthesized forms, e.g.
+# r'\([A-Z]\s*[→∧∨¬≡]\s*[A-Z]\)', are omitted: any match of one contains a
+# match of the bare pattern before it, so they could never be returned.
+_FORMAL_PATTERNS = (
+    re.compile(r'[A-Z]\s*[→∧∨¬≡]\s*[A-Z]', re.IGNORECASE),
+    re.compile(r'[A-Z]\s*(implies|iff)\s*[A-Z]', re.IGNORECASE),
+)
+_IF_THEN_RE = re.compile(r'if\s+(.+?)\s+then\s+(.+)')
+_SPLIT_IMPLIES_RE = re.compile(r'[→]|Implies')
+_SPLIT_AND_RE = re.compile(r'[∧]|And')
+_SPLIT_OR_RE = re.compile(r'[∨]|Or')
+_SPLIT_EQUIVALENT_RE = re.compile(r'\bEquivalent\b')
+_NOT_RE = re.compile(r'¬|Not')
+_CATEGORICAL_RE = re.compile(r'all|some|every|any')
+
+# Results for the fixed demo/evaluation problems, written by precompile_problems.py
+PRECOMPILED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'compiled_problems.json')
+
+@functools.lru_cache(maxsize=None)
+def reasoner_fingerprint() -> str:
+    """
+    Fingerprint of the reasoning code and SymPy version, used to detect stale precompiled results.
+    
+    The source file is read and hashed once per process.
+    
+    Returns:
+        str: Hex digest
+    """
+    with open(os.path.abspath(__file__), 'rb') as source:
+        return hashlib.sha1(source.read() + sympy.__version__.encode('utf-8')).hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def load_precompiled_problems(path: str = PRECOMPILED_PATH) -> Dict[str, Dict[str, Any]]:
+    """
+    Load precompiled reasoning results if they exist and match the current code.
+    
+    Args:
+        path (str): JSON file written by save_precompiled_problems
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Results keyed by problem text (empty if unavailable or stale)
+    """
+    if not os.path.exists(path):
+        return {}
+    
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if data.get('fingerprint') != reasoner_fingerprint():
+            logger.info("Precompiled problems are stale; re-run precompile_problems.py to refresh them")
+            return {}
+        
+        return {problem: logic_result_from_json(result) for problem, result in data['results'].items()}
+    except Exception as e:
+        logger.warning(f"Could not load precompiled problems from {path}: {e}")
+        return {}
+
+def save_precompiled_problems(results: Dict[str, Dict[str, Any]], path: str = PRECOMPILED_PATH):
+    """
+    Write reasoning results for load_precompiled_problems.
+    
+    Results are stored as JSON, with each truth table as its column names and
+    a list of rows, so loading them never executes code.
+    
+    Args:
+        results (Dict[str, Dict[str, Any]]): Results keyed by problem text
+        path (str): JSON file to write
+    """
+    serialized = {problem: logic_result_to_json(result) for problem, result in results.items()}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': reasoner_fingerprint(), 'results': serialized}, f, ensure_ascii=False)
+
+def logic_result_to_json(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a logic reasoning result into JSON-serializable form.
+    
+    Args:
+        result (Dict[str, Any]): Result from LogicReasoner.reason
+        
+    Returns:
+        Dict[str, Any]: The result with its truth table stored by TruthTable.to_rows
+    """
+    if isinstance(result.get('truth_table'), TruthTable):
+        return {**result, 'truth_table': result['truth_table'].to_rows()}
+    return result
+
+def logic_result_from_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild a logic reasoning result stored by logic_result_to_json.
+    
+    Args:
+        data (Dict[str, Any]): Result as loaded from JSON
+        
+    Returns:
+        Dict[str, Any]: The result with its TruthTable restored
+    """
+    if data.get('truth_table') is not None:
+        return {**data, 'truth_table': TruthTable.from_rows(data['truth_table'])}
+    return data
+
+@functools.lru_cache(maxsize=512)
+def _compile_evaluator(expression: BooleanFunction, symbols_list: Tuple[Any, ...]) -> Callable:
+    """
+    Compile the expression into a vectorized NumPy evaluator.
+    
+    Args:
+        expression (BooleanFunction): SymPy boolean expression
+        symbols_list (Tuple[Any, ...]): Symbols in argument order
+        
+    Returns:
+        Callable: Function taking one boolean array per symbol
+    """
+    return lambdify(symbols_list, expression, modules='numpy')
+
+def _evaluate_all_assignments(expression: BooleanFunction, symbols_list: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate the expression under every truth assignment of its symbols.
+    
+    Args:
+        expression (BooleanFunction): SymPy boolean expression
+        symbols_list (List[Any]): Symbols in column order (first is most significant)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Assignment matrix of shape (2**n, n) and result per row
+    """
+    # Build all assignments at once: unpack the big-endian bytes of each row
+    # index so that the first symbol is the most significant bit
+    num_vars = len(symbols_list)
+    num_rows = 2 ** num_vars
+    row_bytes = np.arange(num_rows, dtype='>u8').view(np.uint8).reshape(num_rows, 8)
+    assignments = np.unpackbits(row_bytes, axis=1)[:, -num_vars:].astype(bool)
+    
+    # Evaluate the expression over every row in a single vectorized call
+    evaluator = _compile_evaluator(expression, tuple(symbols_list))
+    results = np.broadcast_to(np.asarray(evaluator(*assignments.T), dtype=bool), (num_rows,))
+    return assignments, results
+
+@functools.lru_cache(maxsize=2048)
+def _is_satisfiable(expression: BooleanFunction) -> bool:
+    """
+    Run SymPy's DPLL satisfiability check, memoized per expression.
+    
+    SymPy expressions hash and compare structurally, so the expression itself
+    serves as the cache key without a round trip through srepr().
+    
+    Args:
+        expression (BooleanFunction): SymPy boolean expression
+        
+    Returns:
+        bool: True if some assignment makes the expression true
+    """
+    return bool(satisfiable(expression))
+
+def _truth_profile(expression: BooleanFunction, symbols_list: Sequence) -> Tuple[bool, bool]:
+    """
+    Decide whether the expression is satisfiable and whether it is a tautology.
+    
+    Disjunctions and conjunctions containing a literal and its negation are
+    decided structurally. Other small formulas are decided from one vectorized
+    evaluation of every assignment; larger ones fall back to SymPy's DPLL solver.
+    
+    Args:
+        expression (BooleanFunction): SymPy boolean expression
+        symbols_list (Sequence): Free symbols of the expression, sorted by name
+        
+    Returns:
+        Tuple[bool, bool]: (satisfiable, tautology)
+    """
+    # Constants need no search at all
+    if expression is sympy.true:
+        return True, True
+    if expression is sympy.false:
+        return False, False
+    
+    # x ∨ ¬x ∨ ... is always true and x ∧ ¬x ∧ ... always false, whatever
+    # the other operands; spot the complementary pair without enumerating
+    if isinstance(expression, (Or, And)):
+        operands = set(expression.args)
+        if any(Not(operand) in operands for operand in operands):
+            is_disjunction = isinstance(expression, Or)
+            return is_disjunction, is_disjunction
+    
+    if 0 < len(symbols_list) <= MAX_TRUTH_TABLE_VARIABLES:
+        _, results = _evaluate_all_assignments(expression, symbols_list)
+        return bool(results.any()), bool(results.all())
+    
+    if not _is_satisfiable(expression):
+        return False, False
+    return True, not _is_satisfiable(Not(expression))
+
+@functools.lru_cache(maxsize=1024)
+def _classify_expression(expression: BooleanFunction, symbols_list: Tuple[Any, ...]) -> Tuple[str, str, float]:
+    """
+    Classify an expression as a tautology, contradiction or contingency.
+    
+    Cached on the expression itself; SymPy expressions hash structurally, so
+    identical formulas parsed from different problems share one entry.
+    
+    Args:
+        expression (BooleanFunction): SymPy expression
+        symbols_list (Tuple[Any, ...]): Free symbols of the expression, sorted by name
+        
+    Returns:
+        Tuple[str, str, float]: Explanation, conclusion and confidence
+    """
+    explanation = f"Analyzing the logical expression: {expression}\n\n"
+    
+    # Check if expression is tautology, contradiction, or contingency
+    # (constants such as sympy.true have no free symbols but do have atoms)
+    if symbols_list or expression.atoms():
+        # Check satisfiability
+        is_satisfiable, is_tautology = _truth_profile(expression, symbols_list)
+        if is_satisfiable:
+            explanation += "The expression is satisfiable (not a contradiction).\n"
+            
+            # A tautology is true under every assignment (its negation is unsatisfiable)
+            if is_tautology:
+                explanation += "The expression is a tautology (always true).\n"
+                conclusion = "The statement is always true (tautology)."
+                confidence = 0.9
+            else:
+                explanation += "The expression is a contingency (sometimes true, sometimes false).\n"
+                conclusion = "The statement depends on the truth values of its components."
+                confidence = 0.7
+        else:
+            explanation += "The expression is a contradiction (never true).\n"
+            conclusion = "The statement is always false (contradiction)."
+            confidence = 0.9
+    else:
+        # No variables, constant expression
+        if expression == True:
+            explanation += "The expression is always true.\n"
+            conclusion = "The statement is always true."
+            confidence = 1.0
+        elif expression == False:
+            explanation += "The expression is always false.\n"
+            conclusion = "The statement is always false."
+            confidence = 1.0
+        else:
+            explanation += "The expression has a constant value.\n"
+            conclusion = f"The statement evaluates to: {expression}"
+            confidence = 0.8
+    
+    return explanation, conclusion, confidence
+
+def _compile_operator_pattern(operator_map: Mapping[str, Any]) -> 're.Pattern':
+    """
+    Build one regex matching every operator keyword or symbol.
+    
+    Word operators only match whole words (so 'or' inside 'Prove' is left
+    alone); longer operators are tried first so 'if and only if' wins over 'if'.
+    
+    Args:
+        operator_map (Mapping[str, Any]): Operator text to SymPy class
+        
+    Returns:
+        re.Pattern: Case-insensitive operator matcher
+    """
+    alternatives = []
+    for op in sorted(operator_map, key=len, reverse=True):
+        escaped = re.escape(op)
+        alternatives.append(rf'\b{escaped}\b' if op[0].isalnum() else escaped)
+    return re.compile('|'.join(alternatives), re.IGNORECASE)
+
+class TruthTable(Sequence):
+    """
+    Truth table backed by a boolean assignment matrix.
+    
+    Behaves like a list of row dictionaries ({symbol: bool, ..., 'Result': bool}),
+    but each row dictionary is only built when it is accessed.
+    """
+    
+    def __init__(self, names: List[str], assignments: np.ndarray, results: np.ndarray):
+        """
+        Initialize the truth table.
+        
+        Args:
+            names (List[str]): Symbol names in column order
+            assignments (np.ndarray): Boolean matrix of shape (rows, len(names))
+            results (np.ndarray): Boolean result per row
+        """
+        self.names = names
+        self.assignments = assignments
+        self.results = results
+    
+    def __len__(self) -> int:
+        return len(self.results)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, bool], List[Dict[str, bool]]]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("truth table row index out of range")
+        return self._row(index)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (TruthTable, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"TruthTable(columns={self.names + ['Result']}, rows={len(self)})"
+    
+    def to_frame(self) -> 'pd.DataFrame':
+        """
+        Build a DataFrame straight from the column arrays.
+        
+        Returns:
+            pd.DataFrame: One boolean column per symbol plus 'Result'
+        """
+        import pandas as pd
+        
+        frame = pd.DataFrame(self.assignments, columns=self.names)
+        frame['Result'] = self.results
+        return frame
+    
+    def to_rows(self) -> Dict[str, List[Any]]:
+        """
+        Get the table as plain lists, for JSON storage.
+        
+        Returns:
+            Dict[str, List[Any]]: 'names' (symbol columns) and 'rows' (symbol values, then the result)
+        """
+        rows = np.column_stack((self.assignments, self.results)).tolist()
+        return {'names': list(self.names), 'rows': rows}
+    
+    @classmethod
+    def from_rows(cls, data: Dict[str, List[Any]]) -> 'TruthTable':
+        """
+        Rebuild a truth table stored by to_rows.
+        
+        Args:
+            data (Dict[str, List[Any]]): 'names' and 'rows' as written by to_rows
+            
+        Returns:
+            TruthTable: The rebuilt table
+        """
+        names = list(data['names'])
+        matrix = np.array(data['rows'], dtype=bool).reshape(-1, len(names) + 1)
+        return cls(names, matrix[:, :-1], matrix[:, -1])
+    
+    def _row(self, index: int) -> Dict[str, bool]:
+        """Build the dictionary for a single row."""
+        row = dict(zip(self.names, self.assignments[index].tolist()))
+        row['Result'] = bool(self.results[index])
+        return row
+
+def truth_table_frame(truth_table: Union[TruthTable, List[Dict[str, Any]]]) -> 'pd.DataFrame':
+    """
+    Convert a truth table from a reasoning result into a DataFrame for display.
+    
+    Args:
+        truth_table (Union[TruthTable, List[Dict[str, Any]]]): Truth table rows
+        
+    Returns:
+        pd.DataFrame: Truth table with one column per symbol plus 'Result'
+    """
+    if isinstance(truth_table, TruthTable):
+        return truth_table.to_frame()
+    
+    import pandas as pd
+    return pd.DataFrame(truth_table)
+
 class LogicReasoner:
     """Logic reasoning using SymPy for propositional logic."""
     
-    def __init__(self):
-        """Initialize the logic reasoner."""
-        self.symbol_map = {}
-        self.operator_map = {
-            'and': And,
-            'or': Or,
-            'not': Not,
-            'implies': Implies,
-            'iff': Equivalent,
-            'if and only if': Equivalent,
-            '→': Implies,
-            '∧': And,
-            '∨': Or,
-            '¬': Not,
-            '≡': Equivalent
-        }
+    # Operator text to SymPy class; shared read-only by every instance
+    operator_map: ClassVar[Mapping[str, Any]] = MappingProxyType({
+        'and': And,
+        'or': Or,
+        'not': Not,
+        'implies': Implies,
+        'iff': Equivalent,
+        'if and only if': Equivalent,
+        '→': Implies,
+        '∧': And,
+        '∨': Or,
+        '¬': Not,
+        '≡': Equivalent
+    })
+    # Substitution text per operator, resolved once instead of per match.
+    # Binary operators are padded so their operands split apart; negation is
+    # not, so 'A¬B' reads as the single atom Not(AB) rather than 'A  B'.
+    _operator_replacements: ClassVar[Mapping[str, str]] = MappingProxyType({
+        op: op_class.__name__ if op_class is Not else f" {op_class.__name__} "
+        for op, op_class in operator_map.items()
+    })
+    operator_pattern: ClassVar['re.Pattern'] = _compile_operator_pattern(operator_map)
+    
+    def __init__(self, use_precompiled: bool = True):
+        """
+        Initialize the logic reasoner.
+        
+        Args:
+            use_precompiled (bool): Serve known problems from compiled_problems.json when available
+        """
+        self.precompiled = load_precompiled_problems() if use_precompiled else {}
+        # Single-letter variables are created up front; others on first use
+        self.symbol_map = {letter: symbols(letter) for letter in string.ascii_uppercase}
+        # Results per problem text, most recently used last. They are kept per
+        # instance so subclasses and instance state are respected; callers
+        # share results by sharing get_logic_reasoner()
+        self._results: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        # Parsed expressions per statement; different problems often quote the
+        # same formula (e.g. 'A → B')
+        self._parsed: 'OrderedDict[str, Optional[BooleanFunction]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def reason(self, problem: str) -> Dict[str, Any]:
         """
         Perform logical reasoning on the given problem.
         
+        Args:
+            problem (str): The problem to analyze
+            
+        Returns:
+            Dict[str, Any]: Logic reasoning result, a deep copy the caller may mutate
+        """
+        # Fixed demo/evaluation problems may already be solved
+        precompiled = self.precompiled.get(problem)
+        if precompiled is not None:
+            return copy.deepcopy(precompiled)
+        
+        result = self._memoized(self._results, problem, self._reason, RESULT_CACHE_SIZE)
+        return copy.deepcopy(result)
+    
+    def _memoized(self, cache: 'OrderedDict[str, Any]', key: str,
+                  compute: Callable[[str], Any], limit: int) -> Any:
+        """
+        Look a key up in one of this reasoner's caches, computing it on a miss.
+        
+        Args:
+            cache (OrderedDict[str, Any]): Cache to consult, most recently used last
+            key (str): Cache key, also the argument passed to compute
+            compute (Callable[[str], Any]): Uncached computation
+            limit (int): Number of entries the cache keeps
+            
+        Returns:
+            Any: Cached or newly computed value
+        """
+        with self._cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        
+        value = compute(key)
+        with self._cache_lock:
+            cache[key] = value
+            while len(cache) > limit:
+                cache.popitem(last=False)
+        return value
+    
+    def _reason(self, problem: str) -> Dict[str, Any]:
+        """
+        Uncached implementation of reason().
+        
         Args:
             problem (str): The problem to analyze
             
@@ -73,15 +532,8 @@ class LogicReasoner:
             Optional[str]: Extracted logical statement or None
         """
         # Look for formal logic symbols
-        formal_patterns = [
-            r'[A-Z]\s*[→∧∨¬≡]\s*[A-Z]',
-            r'\([A-Z]\s*[→∧∨¬≡]\s*[A-Z]\)',
-            r'[A-Z]\s*(implies|iff)\s*[A-Z]',
-            r'\([A-Z]\s*(implies|iff)\s*[A-Z]\)'
-        ]
-        
-        for pattern in formal_patterns:
-            match = re.search(pattern, problem, re.IGNORECASE)
+        for pattern in _FORMAL_PATTERNS:
+            match = pattern.search(problem)
             if match:
                 return match.group(0)
         
@@ -99,8 +551,8 @@ class LogicReasoner:
             Dict[str, Any]: Analysis result
         """
         try:
-            # Parse the statement
-            parsed_expr = self._parse_statement(statement)
+            # Parse the statement (shared across problems quoting the same formula)
+            parsed_expr = self._memoized(self._parsed, statement, self._parse_statement, PARSE_CACHE_SIZE)
             
             if parsed_expr is None:
                 return {
@@ -111,14 +563,23 @@ class LogicReasoner:
                     'success': False
                 }
             
-            # Generate truth table
-            truth_table = self._generate_truth_table(parsed_expr)
+            # Collect the symbols once for both the analysis and the truth table
+            symbols_list = sorted(parsed_expr.free_symbols, key=str)
             
             # Analyze the statement
-            analysis = self._analyze_expression(parsed_expr, original_problem)
+            analysis = self._analyze_expression(parsed_expr, original_problem, symbols_list)
+            explanation = analysis['explanation']
+            
+            # Generate truth table, unless it is too large to be worth showing
+            num_vars = len(symbols_list)
+            if num_vars > MAX_DISPLAY_TRUTH_TABLE_VARIABLES:
+                truth_table = None
+                explanation += f"\nTruth table omitted ({2 ** num_vars} rows for {num_vars} variables).\n"
+            else:
+                truth_table = self._generate_truth_table(parsed_expr, symbols_list)
             
             return {
-                'result': analysis['explanation'],
+                'result': explanation,
                 'truth_table': truth_table,
                 'conclusion': analysis['conclusion'],
                 'confidence': analysis['confidence'],
@@ -150,44 +611,41 @@ class LogicReasoner:
             # Clean the statement
             clean_statement = statement.strip()
             
-            # Replace operators with SymPy equivalents
-            for op, sympy_op in self.operator_map.items():
-                if op in clean_statement.lower():
-                    clean_statement = clean_statement.replace(op, sympy_op.__name__)
-            
-            # Extract variables
-            variables = re.findall(r'\b[A-Z]\b', clean_statement)
-            unique_vars = list(set(variables))
-            
-            # Create symbol mapping
-            sym_vars = {}
-            for var in unique_vars:
-                if var not in self.symbol_map:
-                    self.symbol_map[var] = symbols(var)
-                sym_vars[var] = self.symbol_map[var]
+            # Replace operators with SymPy equivalents in a single pass
+            clean_statement = self.operator_pattern.sub(
+                lambda match: self._operator_replacements[match.group(0).lower()],
+                clean_statement
+            )
             
             # Simple parsing for basic statements
             if '→' in clean_statement or 'Implies' in clean_statement:
-                parts = re.split(r'[→]|Implies', clean_statement)
+                parts = _SPLIT_IMPLIES_RE.split(clean_statement)
                 if len(parts) == 2:
                     left = parts[0].strip()
                     right = parts[1].strip()
                     return Implies(self._parse_atom(left), self._parse_atom(right))
             
+            elif 'Equivalent' in clean_statement:
+                parts = _SPLIT_EQUIVALENT_RE.split(clean_statement)
+                if len(parts) == 2:
+                    left = parts[0].strip()
+                    right = parts[1].strip()
+                    return Equivalent(self._parse_atom(left), self._parse_atom(right))
+            
             elif '∧' in clean_statement or 'And' in clean_statement:
-                parts = re.split(r'[∧]|And', clean_statement)
+                parts = _SPLIT_AND_RE.split(clean_statement)
                 if len(parts) >= 2:
                     atoms = [self._parse_atom(part.strip()) for part in parts]
                     return And(*atoms)
             
             elif '∨' in clean_statement or 'Or' in clean_statement:
-                parts = re.split(r'[∨]|Or', clean_statement)
+                parts = _SPLIT_OR_RE.split(clean_statement)
                 if len(parts) >= 2:
                     atoms = [self._parse_atom(part.strip()) for part in parts]
                     return Or(*atoms)
             
             elif '¬' in clean_statement or 'Not' in clean_statement:
-                atom_part = clean_statement.replace('¬', '').replace('Not', '').strip()
+                atom_part = _NOT_RE.sub('', clean_statement).strip()
                 return Not(self._parse_atom(atom_part))
             
             # If no operators found, treat as single atom
@@ -206,130 +664,76 @@ class LogicReasoner:
             
         Returns:
             Any: SymPy symbol or expression
+            
+        Raises:
+            ValueError: If the text is empty or more than one token
         """
         atom = atom.strip('() ')
-        if atom in self.symbol_map:
-            return self.symbol_map[atom]
-        else:
+        symbol = self.symbol_map.get(atom)
+        if symbol is None and len(atom.split()) != 1:
+            # symbols() would return a tuple for 'A B', which is not a proposition
+            raise ValueError(f"Not an atomic proposition: '{atom}'")
+        if symbol is None:
             # Create new symbol
             symbol = symbols(atom)
-            self.symbol_map[atom] = symbol
-            return symbol
+            self.symbol_map[sys.intern(atom)] = symbol
+        return symbol
     
-    def _generate_truth_table(self, expression: BooleanFunction) -> List[Dict[str, Any]]:
+    def _generate_truth_table(self, expression: BooleanFunction,
+                              symbols_list: Optional[List[Any]] = None) -> Union[TruthTable, List[Dict[str, Any]]]:
         """
         Generate truth table for the given expression.
         
         Args:
             expression (BooleanFunction): SymPy boolean expression
+            symbols_list (List[Any], optional): Free symbols sorted by name, if already known
             
         Returns:
-            List[Dict[str, Any]]: Truth table as list of dictionaries
+            Union[TruthTable, List[Dict[str, Any]]]: Truth table rows (empty list on failure)
         """
         try:
             # Get all symbols in the expression
-            symbols_list = list(expression.atoms())
-            symbols_list.sort(key=str)  # Sort for consistent ordering
+            if symbols_list is None:
+                symbols_list = sorted(expression.free_symbols, key=str)  # Sort for consistent ordering
             
             if not symbols_list:
                 return []
             
-            # Generate all possible truth value combinations
-            truth_table = []
-            num_vars = len(symbols_list)
+            if len(symbols_list) > MAX_TRUTH_TABLE_VARIABLES:
+                logger.warning(
+                    "Skipping truth table for %d variables (limit is %d)",
+                    len(symbols_list), MAX_TRUTH_TABLE_VARIABLES
+                )
+                return []
             
-            for i in range(2 ** num_vars):
-                # Convert i to binary and create assignment
-                binary = format(i, f'0{num_vars}b')
-                assignment = {}
-                
-                for j, symbol in enumerate(symbols_list):
-                    assignment[symbol] = binary[j] == '1'
-                
-                # Evaluate expression with this assignment
-                try:
-                    result = expression.subs(assignment)
-                    if hasattr(result, 'simplify'):
-                        result = result.simplify()
-                    
-                    # Convert result to boolean
-                    if result == True:
-                        result_value = True
-                    elif result == False:
-                        result_value = False
-                    else:
-                        result_value = str(result)
-                    
-                    # Create row
-                    row = {}
-                    for symbol in symbols_list:
-                        row[str(symbol)] = assignment[symbol]
-                    row['Result'] = result_value
-                    
-                    truth_table.append(row)
-                    
-                except Exception as e:
-                    logger.error(f"Error evaluating expression: {e}")
-                    continue
-            
-            return truth_table
+            assignments, results = _evaluate_all_assignments(expression, symbols_list)
+            return TruthTable([str(symbol) for symbol in symbols_list], assignments, results)
             
         except Exception as e:
             logger.error(f"Error generating truth table: {e}")
             return []
     
-    def _analyze_expression(self, expression: BooleanFunction, original_problem: str) -> Dict[str, Any]:
+    def _analyze_expression(self, expression: BooleanFunction, original_problem: str,
+                            symbols_list: Optional[List[Any]] = None) -> Dict[str, Any]:
         """
         Analyze a logical expression and provide interpretation.
         
         Args:
             expression (BooleanFunction): SymPy expression
             original_problem (str): Original problem for context
+            symbols_list (List[Any], optional): Free symbols sorted by name, if already known
             
         Returns:
             Dict[str, Any]: Analysis result
         """
         try:
-            explanation = f"Analyzing the logical expression: {expression}\n\n"
-            
-            # Check if expression is tautology, contradiction, or contingency
-            symbols_list = list(expression.atoms())
-            
-            if symbols_list:
-                # Check satisfiability
-                if satisfiable(expression):
-                    explanation += "The expression is satisfiable (not a contradiction).\n"
-                    
-                    # Check if it's a tautology by checking if its negation is unsatisfiable
-                    if not satisfiable(Not(expression)):
-                        explanation += "The expression is a tautology (always true).\n"
-                        conclusion = "The statement is always true (tautology)."
-                        confidence = 0.9
-                    else:
-                        explanation += "The expression is a contingency (sometimes true, sometimes false).\n"
-                        conclusion = "The statement depends on the truth values of its components."
-                        confidence = 0.7
-                else:
-                    explanation += "The expression is a contradiction (never true).\n"
-                    conclusion = "The statement is always false (contradiction)."
-                    confidence = 0.9
-            else:
-                # No variables, constant expression
-                if expression == True:
-                    explanation += "The expression is always true.\n"
-                    conclusion = "The statement is always true."
-                    confidence = 1.0
-                elif expression == False:
-                    explanation += "The expression is always false.\n"
-                    conclusion = "The statement is always false."
-                    confidence = 1.0
-                else:
-                    explanation += "The expression has a constant value.\n"
-                    conclusion = f"The statement evaluates to: {expression}"
-                    confidence = 0.8
+            if symbols_list is None:
+                symbols_list = sorted(expression.free_symbols, key=str)
+            explanation, conclusion, confidence = _classify_expression(expression, tuple(symbols_list))
             
             # Add context from original problem
-            if 'if' in original_problem.lower() and 'then' in original_problem.lower():
+            problem_lower = original_problem.lower()
+            if 'if' in problem_lower and 'then' in problem_lower:
                 explanation += "\nThis appears to be a conditional statement (if-then).\n"
             
             return {
@@ -357,12 +761,14 @@ class LogicReasoner:
             Dict[str, Any]: Analysis result
         """
         try:
+            problem_lower = problem.lower()
+            
             # Look for conditional statements
-            if 'if' in problem.lower() and 'then' in problem.lower():
-                return self._analyze_conditional(problem)
+            if 'if' in problem_lower and 'then' in problem_lower:
+                return self._analyze_conditional(problem, problem_lower)
             
-            # Look for categorical statements
-            if any(word in problem.lower() for word in ['all', 'some', 'every', 'any']):
+            # Look for categorical statements (substring match, e.g. 'everyone')
+            if _CATEGORICAL_RE.search(problem_lower):
                 return self._analyze_categorical(problem)
             
             # Default analysis
@@ -384,19 +790,22 @@ class LogicReasoner:
                 'success': False
             }
     
-    def _analyze_conditional(self, problem: str) -> Dict[str, Any]:
+    def _analyze_conditional(self, problem: str, problem_lower: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze conditional statements.
         
         Args:
             problem (str): Problem containing conditional
+            problem_lower (str, optional): Lowercased problem, if already computed
             
         Returns:
             Dict[str, Any]: Analysis result
         """
         try:
             # Extract conditional parts
-            if_match = re.search(r'if\s+(.+?)\s+then\s+(.+)', problem.lower())
+            if problem_lower is None:
+                problem_lower = problem.lower()
+            if_match = _IF_THEN_RE.search(problem_lower)
             if if_match:
                 antecedent = if_match.group(1).strip()
                 consequent = if_match.group(2).strip()
@@ -463,9 +872,10 @@ class LogicReasoner:
             'success': False
         }
 
+@functools.lru_cache(maxsize=None)
 def get_logic_reasoner() -> LogicReasoner:
     """
-    Factory function to create a logic reasoner.
+    Get the process-wide logic reasoner, creating it on first use.
     
     Returns:
         LogicReasoner: Configured reasoner instance
@@ -3,18 +3,42 @@ Main Streamlit Interface for Dual Modality Reasoning Agent
 """
 
 import streamlit as st
-import pandas as pd
+import os
+import sys
+import json
 import time
-from typing import Dict, Any
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Optional
 import logging
 
-from integration import get_dual_modality_controller
+from integration import is_cacheable_result, process_problem_in_worker
+from logic_reasoning import logic_result_from_json, logic_result_to_json, reasoner_fingerprint
+from reasoning_core import load_selected_problem, truth_table_display_frame
 from utils import validate_input
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of analyses kept in each session's history
+HISTORY_LIMIT = 20
+
+# Worker processes for problem analysis, and how long to wait for one result
+ANALYSIS_WORKERS = 2
+ANALYSIS_TIMEOUT_SECONDS = 60
+
+# On-disk cache of analysis results, kept across app restarts as one JSON file
+# per result (never pickled, like PRECOMPILED_PATH). Entries are keyed by the
+# logic reasoner fingerprint and RESULT_CACHE_VERSION; bump the version when
+# other result-producing code (integration, NL reasoning) changes. The
+# directory sits next to this file rather than the working directory.
+RESULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'mot', 'analysis')
+RESULT_CACHE_VERSION = 2
+
 # Page configuration
 st.set_page_config(
     page_title="Dual Modality Reasoning Agent",
@@ -23,8 +47,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Static page markup. Streamlit rebuilds the page on every rerun, so these
+# are emitted each run, but only defined once here.
+CUSTOM_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -61,43 +86,184 @@ st.markdown("""
         font-size: 0.9rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+HEADER_HTML = """
+    <div class="main-header">
+        <h1>🧠 Dual Modality Reasoning Agent</h1>
+        <p>Integrating Natural Language and Formal Logic Reasoning</p>
+    </div>
+    """
+
+FOOTER_HTML = """
+    <div style="text-align: center; color: #666; font-size: 0.9rem;">
+        <p>Dual Modality Reasoning Agent - Research Project</p>
+        <p>Combining Natural Language and Formal Logic Reasoning</p>
+    </div>
+    """
+
+EXAMPLE_PROBLEMS = (
+    "If it rains, the ground is wet. It's raining. Is the ground wet?",
+    "All birds can fly. Penguins are birds. Can penguins fly?",
+    "Prove that (A → B) ∧ (B → C) implies (A → C)",
+    "If John studies, he passes. John studied. What happened?",
+    "Is the statement 'P ∧ ¬P' always true or always false?",
+    "If A implies B, and B implies C, does A imply C?"
+)
+
+# Custom CSS for better styling
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 def initialize_session_state():
     """Initialize session state variables."""
-    if 'controller' not in st.session_state:
-        st.session_state.controller = None
     if 'processing_history' not in st.session_state:
-        st.session_state.processing_history = []
+        st.session_state.processing_history = deque(maxlen=HISTORY_LIMIT)
     if 'api_key_set' not in st.session_state:
         st.session_state.api_key_set = False
 
 def setup_controller():
-    """Setup the dual modality controller with API key."""
+    """
+    Check that an API key is available for natural language reasoning.
+    
+    Problems are analyzed by controllers in the worker processes (see
+    analyze_problem), so nothing is built here; the key is only recorded.
+    
+    Returns:
+        bool: True if a key is set in the sidebar or the environment
+    """
     api_key = st.session_state.get('api_key_input', '')
     
     if api_key and not st.session_state.api_key_set:
-        try:
-            st.session_state.controller = get_dual_modality_controller(api_key)
-            st.session_state.api_key_set = True
-            st.success("✅ API key configured successfully!")
-            return True
-        except Exception as e:
-            st.error(f"❌ Error setting up controller: {str(e)}")
-            return False
-    elif st.session_state.controller is None:
-        # Try to use environment variable
-        import os
-        if os.getenv('GOOGLE_AI_API_KEY'):
-            try:
-                st.session_state.controller = get_dual_modality_controller()
-                st.session_state.api_key_set = True
-                return True
-            except Exception as e:
-                logger.error(f"Error setting up controller with env var: {e}")
+        st.session_state.api_key_set = True
+        st.success("✅ API key configured successfully!")
+    elif os.getenv('GOOGLE_AI_API_KEY'):
+        # Fall back to the environment variable
+        st.session_state.api_key_set = True
     
     return st.session_state.api_key_set
 
+@st.cache_resource(show_spinner=False)
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the worker pool shared by all sessions.
+    
+    Problems are analyzed in separate processes so that a pathological formula
+    (slow SymPy parsing or satisfiability search) cannot stall the script thread.
+    
+    Returns:
+        ProcessPoolExecutor: Shared process pool
+    """
+    return ProcessPoolExecutor(max_workers=ANALYSIS_WORKERS)
+
+def reset_process_pool():
+    """
+    Replace the shared worker pool with a fresh one on its next use.
+    
+    A running task cannot be cancelled, so a pool with a stuck (timed out)
+    task would keep that worker busy for good; its processes are terminated
+    instead, and any tasks still queued on it are cancelled.
+    """
+    pool = get_process_pool()
+    get_process_pool.clear()
+    # Snapshot the workers first; shutdown() forgets them
+    processes = list((pool._processes or {}).values())
+    if sys.version_info >= (3, 9):
+        pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        # cancel_futures needs Python 3.9; queued tasks fail with
+        # BrokenProcessPool once the workers are terminated
+        pool.shutdown(wait=False)
+    for process in processes:
+        process.terminate()
+
+def result_cache_key(problem: str, api_key: Optional[str]) -> str:
+    """
+    Build the on-disk cache key for a problem.
+    
+    Args:
+        problem (str): The problem to analyze
+        api_key (str, optional): Google AI API key the result was produced with
+        
+    Returns:
+        str: Hex digest identifying the problem, key and code version
+    """
+    tag = f"{RESULT_CACHE_VERSION}:{reasoner_fingerprint()}:{api_key or ''}:{problem.strip()}"
+    return hashlib.sha1(tag.encode('utf-8')).hexdigest()
+
+def load_cached_result(key: str) -> Optional[Dict[str, Any]]:
+    """Load an analysis result from the on-disk cache, if present."""
+    path = os.path.join(RESULT_CACHE_DIR, f"{key}.json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+        if result.get('logic_reasoning') is not None:
+            result['logic_reasoning'] = logic_result_from_json(result['logic_reasoning'])
+        return result
+    except Exception as e:
+        logger.warning(f"Could not read result cache: {e}")
+        return None
+
+def store_cached_result(key: str, result: Dict[str, Any]):
+    """Persist a reusable analysis result to the on-disk cache."""
+    if not is_cacheable_result(result):
+        return
+    if result.get('logic_reasoning') is not None:
+        result = {**result, 'logic_reasoning': logic_result_to_json(result['logic_reasoning'])}
+    try:
+        os.makedirs(RESULT_CACHE_DIR, exist_ok=True)
+        path = os.path.join(RESULT_CACHE_DIR, f"{key}.json")
+        # Write a private file first so readers never see a partial result
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not write result cache: {e}")
+
+def analyze_problem(problem: str) -> Dict[str, Any]:
+    """
+    Analyze a problem, reusing on-disk results and otherwise running it in
+    the process pool with a timeout.
+    
+    Args:
+        problem (str): The problem to analyze
+        
+    Returns:
+        Dict[str, Any]: Processing result, or an error result on timeout
+    """
+    api_key = st.session_state.get('api_key_input') or None
+    cache_key = result_cache_key(problem, api_key)
+    cached = load_cached_result(cache_key)
+    if cached is not None:
+        return cached
+    
+    future = get_process_pool().submit(process_problem_in_worker, problem, api_key)
+    try:
+        result = future.result(timeout=ANALYSIS_TIMEOUT_SECONDS)
+    except FuturesTimeoutError:
+        # The worker is still running the problem; replace the pool so it
+        # does not hold one of the few workers for every later request
+        reset_process_pool()
+        logger.error("Analysis timed out after %s seconds", ANALYSIS_TIMEOUT_SECONDS)
+        return {
+            'success': False,
+            'error': f"Analysis timed out after {ANALYSIS_TIMEOUT_SECONDS} seconds. Try a simpler problem."
+        }
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool for the next request
+        reset_process_pool()
+        raise
+    
+    store_cached_result(cache_key, result)
+    return result
+
+def show_truth_table(logic_result: Dict[str, Any]):
+    """Display the truth table of a logic reasoning result."""
+    st.markdown("**Truth Table:**")
+    st.dataframe(truth_table_display_frame(logic_result), use_container_width=True)
+
 def display_mode_selection(mode_selection: Dict[str, Any]):
     """Display the reasoning mode selection information."""
     st.markdown("### 🎯 Reasoning Mode Selection")
@@ -163,9 +329,7 @@ def display_result(result: Dict[str, Any]):
                     
                     # Display truth table if available
                     if result['logic_reasoning']['truth_table']:
-                        st.markdown("**Truth Table:**")
-                        df = pd.DataFrame(result['logic_reasoning']['truth_table'])
-                        st.dataframe(df, use_container_width=True)
+                        show_truth_table(result['logic_reasoning'])
                 else:
                     st.text("No logic analysis available")
         
@@ -183,9 +347,7 @@ def display_result(result: Dict[str, Any]):
                 
                 # Display truth table if available
                 if result['logic_reasoning']['truth_table']:
-                    st.markdown("**Truth Table:**")
-                    df = pd.DataFrame(result['logic_reasoning']['truth_table'])
-                    st.dataframe(df, use_container_width=True)
+                    show_truth_table(result['logic_reasoning'])
             else:
                 st.text("Logic analysis failed")
 
@@ -193,31 +355,22 @@ def display_example_problems():
     """Display example problems in the sidebar."""
     st.sidebar.markdown("### 📚 Example Problems")
     
-    examples = [
-        "If it rains, the ground is wet. It's raining. Is the ground wet?",
-        "All birds can fly. Penguins are birds. Can penguins fly?",
-        "Prove that (A → B) ∧ (B → C) implies (A → C)",
-        "If John studies, he passes. John studied. What happened?",
-        "Is the statement 'P ∧ ¬P' always true or always false?",
-        "If A implies B, and B implies C, does A imply C?"
-    ]
-    
-    for i, example in enumerate(examples, 1):
-        if st.sidebar.button(f"Example {i}", key=f"example_{i}"):
-            st.session_state.problem_input = example
-            st.rerun()
+    st.sidebar.selectbox(
+        "Load an example",
+        EXAMPLE_PROBLEMS,
+        index=None,
+        placeholder="Choose an example...",
+        key="example_picker",
+        on_change=load_selected_problem,
+        args=("example_picker",)
+    )
 
 def main():
     """Main Streamlit application."""
     initialize_session_state()
     
     # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>🧠 Dual Modality Reasoning Agent</h1>
-        <p>Integrating Natural Language and Formal Logic Reasoning</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # Sidebar configuration
     with st.sidebar:
@@ -246,10 +399,17 @@ def main():
         # Processing history
         if st.session_state.processing_history:
             st.markdown("### 📊 Recent Problems")
-            for i, history_item in enumerate(st.session_state.processing_history[-5:], 1):
-                if st.button(f"{i}. {history_item['problem'][:50]}...", key=f"history_{i}"):
-                    st.session_state.problem_input = history_item['problem']
-                    st.rerun()
+            recent = [item['problem'] for item in list(st.session_state.processing_history)[-5:]]
+            st.selectbox(
+                "Load a recent problem",
+                recent,
+                index=None,
+                placeholder="Choose a problem...",
+                format_func=lambda problem: f"{problem[:50]}...",
+                key="history_picker",
+                on_change=load_selected_problem,
+                args=("history_picker",)
+            )
     
     # Main interface
     st.markdown("### 💭 Enter Your Problem")
@@ -277,12 +437,12 @@ def main():
                 # Process the problem
                 with st.spinner("🧠 Analyzing problem..."):
                     try:
-                        result = st.session_state.controller.process_problem(problem)
+                        result = analyze_problem(problem)
                         
-                        # Store in history
+                        # Store in history (only what the sidebar needs, not the full result)
                         st.session_state.processing_history.append({
                             'problem': problem,
-                            'result': result,
+                            'conclusion': result.get('conclusion'),
                             'timestamp': time.time()
                         })
                         
@@ -298,12 +458,7 @@ def main():
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; font-size: 0.9rem;">
-        <p>Dual Modality Reasoning Agent - Research Project</p>
-        <p>Combining Natural Language and Formal Logic Reasoning</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
@@ -4,19 +4,51 @@ Clean, minimal, professional design for academic demonstrations
 """
 
 import streamlit as st
-import pandas as pd
 import time
 from typing import Dict, Any
 import logging
 
-from logic_reasoning import get_logic_reasoner
-from utils import detect_logical_keywords, validate_input
-from sample_problems import get_all_problems, get_problems_by_category
+from reasoning_core import (
+    analyze_problem as analyze_with_modes,
+    initialize_session_state,
+    load_problem,
+    truth_table_display_frame
+)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging once per process rather than on every Streamlit rerun
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# (mode, explanation) indexed by formal_logic << 1 | (connectives or conditionals);
+# formal logic symbols take precedence over other logical structure
+ANALYSIS_MODES = (
+    ('General Analysis', "Using general logical analysis approach."),
+    ('Logical Structure Analysis', "Detected logical structure. Using propositional logic analysis."),
+    ('Formal Logic Analysis', "Detected formal logic symbols. Using symbolic reasoning."),
+    ('Formal Logic Analysis', "Detected formal logic symbols. Using symbolic reasoning."),
+)
+
+# (feature key, label) pairs shown as pills, in display order
+FEATURE_LABELS = (
+    ('formal_logic', 'Formal Logic Symbols'),
+    ('logical_connectives', 'Logical Connectives'),
+    ('conditionals', 'Conditional Statements'),
+    ('quantifiers', 'Quantifiers'),
+    ('questions', 'Question Format'),
+)
+
+# HTML skeletons for the analysis result; only the values change between renders
+SUMMARY_TEMPLATE = (
+    '#### Analysis Summary\n\n'
+    '<div class="summary-grid">'
+    '<div><div class="label">Reasoning Mode</div><div class="value">{mode}</div></div>'
+    '<div><div class="label">Confidence</div><div class="value {confidence_class}">{confidence:.2f}</div></div>'
+    '<div><div class="label">Status</div><div class="value {status_class}">{status}</div></div>'
+    '</div>'
+)
+FEATURES_TEMPLATE = '<div class="card"><div class="feature-list">{pills}</div></div>'
+
 # Page configuration
 st.set_page_config(
     page_title="Dual Modality Reasoning Agent",
@@ -25,8 +57,9 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Clean, minimal CSS
-st.markdown("""
+# Static page CSS. Streamlit drops any element a rerun does not emit again,
+# so this is sent every run, but only defined once here.
+CUSTOM_CSS = """
 <style>
     /* Reset/defaults */
     body, .css-1v0mbdj, .block-container {
@@ -81,6 +114,17 @@ st.markdown("""
         color: #0f172a;
     }
 
+    .summary-grid, .status-grid {
+        display: grid;
+        gap: 1rem;
+        margin-bottom: 1.2rem;
+    }
+
+    .summary-grid { grid-template-columns: 2fr 1fr 1fr; }
+    .status-grid { grid-template-columns: repeat(3, 1fr); }
+
+    .status-grid .card { margin-bottom: 0; }
+
     .confidence-high { color: #16a34a; }
     .confidence-medium { color: #eab308; }
     .confidence-low { color: #dc2626; }
@@ -138,14 +182,10 @@ st.markdown("""
         filter: brightness(1.05);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-def initialize_session_state():
-    """Initialize session state variables."""
-    if 'logic_reasoner' not in st.session_state:
-        st.session_state.logic_reasoner = get_logic_reasoner()
-    if 'processing_history' not in st.session_state:
-        st.session_state.processing_history = []
+# Clean, minimal CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 def analyze_problem(problem: str) -> Dict[str, Any]:
     """
@@ -157,51 +197,7 @@ def analyze_problem(problem: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Analysis result
     """
-    # Validate input
-    validation = validate_input(problem)
-    if not validation['valid']:
-        return {
-            'error': validation['error'],
-            'success': False
-        }
-    
-    try:
-        # Detect logical features
-        logical_features = detect_logical_keywords(problem)
-        
-        # Determine reasoning mode based on features
-        if logical_features['formal_logic']:
-            mode = 'Formal Logic Analysis'
-            explanation = "Detected formal logic symbols. Using symbolic reasoning."
-        elif logical_features['logical_connectives'] or logical_features['conditionals']:
-            mode = 'Logical Structure Analysis'
-            explanation = "Detected logical structure. Using propositional logic analysis."
-        else:
-            mode = 'General Analysis'
-            explanation = "Using general logical analysis approach."
-        
-        # Analyze with logic reasoner
-        logic_result = st.session_state.logic_reasoner.reason(problem)
-        
-        # Calculate overall confidence
-        confidence = logic_result['confidence']
-        
-        return {
-            'success': True,
-            'mode': mode,
-            'explanation': explanation,
-            'logic_result': logic_result,
-            'confidence': confidence,
-            'conclusion': logic_result['conclusion'],
-            'features': logical_features
-        }
-        
-    except Exception as e:
-        logger.error(f"Error analyzing problem: {e}")
-        return {
-            'error': f"Error analyzing problem: {str(e)}",
-            'success': False
-        }
+    return analyze_with_modes(problem, ANALYSIS_MODES)
 
 def display_analysis_result(result: Dict[str, Any]):
     """Display the analysis result in a clean, research-grade format."""
@@ -209,46 +205,34 @@ def display_analysis_result(result: Dict[str, Any]):
         st.error(f"**Error:** {result.get('error', 'Unknown error')}")
         return
     
-    # Analysis Summary
-    st.markdown("#### Analysis Summary")
-    with st.container():
-        cols = st.columns([2, 1, 1])
-        with cols[0]:
-            st.markdown('<div class="label">Reasoning Mode</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="value">{result["mode"]}</div>', unsafe_allow_html=True)
-        with cols[1]:
-            st.markdown('<div class="label">Confidence</div>', unsafe_allow_html=True)
-            confidence_class = 'confidence-high' if result['confidence'] > 0.7 else 'confidence-medium' if result['confidence'] > 0.4 else 'confidence-low'
-            st.markdown(f'<div class="value {confidence_class}">{result["confidence"]:.2f}</div>', unsafe_allow_html=True)
-        with cols[2]:
-            st.markdown('<div class="label">Status</div>', unsafe_allow_html=True)
-            status_html = '<div class="value confidence-high">Success</div>' if result['success'] else '<div class="value confidence-low">Failed</div>'
-            st.markdown(status_html, unsafe_allow_html=True)
+    # Analysis Summary (one markdown element for the heading and whole row)
+    confidence_class = 'confidence-high' if result['confidence'] > 0.7 else 'confidence-medium' if result['confidence'] > 0.4 else 'confidence-low'
+    st.markdown(
+        SUMMARY_TEMPLATE.format(
+            mode=result['mode'],
+            confidence=result['confidence'],
+            confidence_class=confidence_class,
+            status='Success' if result['success'] else 'Failed',
+            status_class='confidence-high' if result['success'] else 'confidence-low'
+        ),
+        unsafe_allow_html=True
+    )
     
     # Features Detected
     st.markdown("#### Features Detected")
     features = result['features']
-    feature_text = []
-    if features['formal_logic']:
-        feature_text.append("Formal Logic Symbols")
-    if features['logical_connectives']:
-        feature_text.append("Logical Connectives")
-    if features['conditionals']:
-        feature_text.append("Conditional Statements")
-    if features['quantifiers']:
-        feature_text.append("Quantifiers")
-    if features['questions']:
-        feature_text.append("Question Format")
+    pills = "".join(
+        f'<span class="feature-pill">{label}</span>'
+        for name, label in FEATURE_LABELS if features[name]
+    )
     
-    if feature_text:
-        pills = "".join([f'<span class="feature-pill">{txt}</span>' for txt in feature_text])
-        st.markdown(f'<div class="card"><div class="feature-list">{pills}</div></div>', unsafe_allow_html=True)
+    if pills:
+        st.markdown(FEATURES_TEMPLATE.format(pills=pills), unsafe_allow_html=True)
     else:
         st.info("No specific logical features detected.")
     
-    # Reasoning Process
-    st.markdown("#### Reasoning Process")
-    st.markdown(f"**Approach** · {result['explanation']}")
+    # Reasoning Process (heading and approach in one element)
+    st.markdown(f"#### Reasoning Process\n\n**Approach** · {result['explanation']}")
     
     # Logic Analysis
     if result['logic_result']['success']:
@@ -259,7 +243,7 @@ def display_analysis_result(result: Dict[str, Any]):
         # Truth Table
         if result['logic_result']['truth_table']:
             st.markdown("#### Truth Table")
-            df = pd.DataFrame(result['logic_result']['truth_table'])
+            df = truth_table_display_frame(result['logic_result'])
             st.dataframe(df, use_container_width=True, hide_index=True)
         else:
             st.info("No truth table was generated for this expression.")
@@ -268,20 +252,44 @@ def display_analysis_result(result: Dict[str, Any]):
     st.markdown("#### Final Conclusion")
     st.success(result['conclusion'])
 
+def history_summary(result: Dict[str, Any]) -> str:
+    """
+    Format the markdown shown for an analysis in the history.
+    
+    Args:
+        result (Dict[str, Any]): Result of analyze_problem
+        
+    Returns:
+        str: Mode, confidence and conclusion, or the error
+    """
+    if not result['success']:
+        return f"**Error:** {result.get('error', 'Unknown error')}"
+    return (
+        f"**Mode:** {result['mode']}\n\n"
+        f"**Confidence:** {result['confidence']:.2f}\n\n"
+        f"**Conclusion:** {result['conclusion']}"
+    )
+
 def main():
     """Main Streamlit application."""
     initialize_session_state()
     
     # Clean header
-    st.markdown('<h1 class="main-title">Dual Modality Reasoning Agent</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Research Demonstration · Integrating Formal Logic with Natural Language Reasoning</p>', unsafe_allow_html=True)
+    st.markdown(
+        '<h1 class="main-title">Dual Modality Reasoning Agent</h1>'
+        '<p class="subtitle">Research Demonstration · Integrating Formal Logic with Natural Language Reasoning</p>',
+        unsafe_allow_html=True
+    )
     
     # System status
-    with st.container():
-        cols = st.columns([1, 1, 1])
-        cols[0].markdown('<div class="card"><div class="label">Logic Engine</div><div class="value confidence-high">Active</div></div>', unsafe_allow_html=True)
-        cols[1].markdown('<div class="card"><div class="label">SymPy Integration</div><div class="value confidence-high">Ready</div></div>', unsafe_allow_html=True)
-        cols[2].markdown('<div class="card"><div class="label">Truth Tables</div><div class="value confidence-high">Available</div></div>', unsafe_allow_html=True)
+    st.markdown(
+        '<div class="status-grid">'
+        '<div class="card"><div class="label">Logic Engine</div><div class="value confidence-high">Active</div></div>'
+        '<div class="card"><div class="label">SymPy Integration</div><div class="value confidence-high">Ready</div></div>'
+        '<div class="card"><div class="label">Truth Tables</div><div class="value confidence-high">Available</div></div>'
+        '</div>',
+        unsafe_allow_html=True
+    )
     
     # Example problems section
     st.markdown("#### Example Problems")
@@ -299,9 +307,7 @@ def main():
     cols = st.columns(3, gap="medium")
     for idx, example in enumerate(examples):
         with cols[idx % 3]:
-            if st.button(example, key=f"example_{idx}"):
-                st.session_state.problem_input = example
-                st.experimental_rerun()
+            st.button(example, key=f"example_{idx}", on_click=load_problem, args=(example,))
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Main input section
@@ -323,11 +329,13 @@ def main():
                 try:
                     result = analyze_problem(problem)
                     
-                    # Store in history
+                    # Store in history, with its display text formatted once here
                     st.session_state.processing_history.append({
                         'problem': problem,
                         'result': result,
-                        'timestamp': time.time()
+                        'timestamp': time.time(),
+                        'title': problem[:50] + ('...' if len(problem) > 50 else ''),
+                        'summary_md': history_summary(result)
                     })
                     
                     # Display results
@@ -340,14 +348,9 @@ def main():
     # Processing history
     if st.session_state.processing_history:
         st.markdown("### Recent Analyses")
-        for i, history_item in enumerate(st.session_state.processing_history[-3:], 1):
-            with st.expander(f"Analysis {i}: {history_item['problem'][:50]}{'...' if len(history_item['problem']) > 50 else ''}"):
-                if history_item['result']['success']:
-                    st.write(f"**Mode:** {history_item['result']['mode']}")
-                    st.write(f"**Confidence:** {history_item['result']['confidence']:.2f}")
-                    st.write(f"**Conclusion:** {history_item['result']['conclusion']}")
-                else:
-                    st.write(f"**Error:** {history_item['result'].get('error', 'Unknown error')}")
+        for i, history_item in enumerate(list(st.session_state.processing_history)[-3:], 1):
+            with st.expander(f"Analysis {i}: {history_item['title']}"):
+                st.markdown(history_item['summary_md'])
     
     # Footer
     st.markdown("---")
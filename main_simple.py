@@ -4,19 +4,55 @@ Works without external API dependencies
 """
 
 import streamlit as st
-import pandas as pd
 import time
 from typing import Dict, Any
 import logging
 
-from logic_reasoning import get_logic_reasoner
-from utils import detect_logical_keywords, validate_input
-from sample_problems import get_all_problems, get_problems_by_category
+from reasoning_core import (
+    analyze_problem as analyze_with_modes,
+    initialize_session_state,
+    load_problem,
+    load_selected_problem,
+    truth_table_display_frame
+)
+from sample_problems import get_problems_by_category
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging once per process rather than on every Streamlit rerun
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# (mode, explanation) indexed by formal_logic << 1 | (connectives or conditionals);
+# formal logic symbols take precedence over other logical structure
+ANALYSIS_MODES = (
+    ('Natural Language Only (Fallback)', "No clear logical structure. Using fallback reasoning."),
+    ('Dual Mode (Logic Focus)', "Logical structure detected. Using logic reasoning with natural language context."),
+    ('Logic Only', "Formal logic symbols detected. Using logic reasoning."),
+    ('Logic Only', "Formal logic symbols detected. Using logic reasoning."),
+)
+
+# HTML skeletons for the analysis result; only the values change between renders
+MODE_INFO_TEMPLATE = """
+<div class="mode-info">
+    <h4>{mode_color} Selected Mode: {mode}</h4>
+    <p><strong>Explanation:</strong> {explanation}</p>
+    <p><strong>Features Detected:</strong></p>
+    <ul>
+        <li>Logical Connectives: {logical_connectives}</li>
+        <li>Conditionals: {conditionals}</li>
+        <li>Formal Logic: {formal_logic}</li>
+        <li>Quantifiers: {quantifiers}</li>
+        <li>Questions: {questions}</li>
+    </ul>
+</div>
+"""
+RESULT_BOX_TEMPLATE = """
+<div class="result-box">
+    <h3>{conclusion}</h3>
+    <p><strong>Confidence:</strong> <span class="confidence-{confidence_level}">{confidence:.2f}</span></p>
+</div>
+"""
+
 # Page configuration
 st.set_page_config(
     page_title="Dual Modality Reasoning Agent",
@@ -25,8 +61,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Static page CSS. Streamlit drops any element a rerun does not emit again,
+# so this is sent every run, but only defined once here.
+CUSTOM_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -63,14 +100,18 @@ st.markdown("""
         font-size: 0.9rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Custom CSS for better styling
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
-def initialize_session_state():
-    """Initialize session state variables."""
-    if 'logic_reasoner' not in st.session_state:
-        st.session_state.logic_reasoner = get_logic_reasoner()
-    if 'processing_history' not in st.session_state:
-        st.session_state.processing_history = []
+# Sidebar examples: the first two problems of each category, selected once
+SIDEBAR_EXAMPLE_LABELS = {
+    problem['problem']: f"{category.title()}: {problem['problem'][:40]}..."
+    for category in ('conditional', 'formal_logic', 'categorical')
+    for problem in get_problems_by_category(category)[:2]
+}
+SIDEBAR_EXAMPLES = tuple(SIDEBAR_EXAMPLE_LABELS)
 
 def analyze_problem(problem: str) -> Dict[str, Any]:
     """
@@ -82,63 +123,19 @@ def analyze_problem(problem: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Analysis result
     """
-    # Validate input
-    validation = validate_input(problem)
-    if not validation['valid']:
-        return {
-            'error': validation['error'],
-            'success': False
-        }
-    
-    try:
-        # Detect logical features
-        logical_features = detect_logical_keywords(problem)
-        
-        # Determine reasoning mode based on features
-        if logical_features['formal_logic']:
-            mode = 'Logic Only'
-            explanation = "Formal logic symbols detected. Using logic reasoning."
-        elif logical_features['logical_connectives'] or logical_features['conditionals']:
-            mode = 'Dual Mode (Logic Focus)'
-            explanation = "Logical structure detected. Using logic reasoning with natural language context."
-        else:
-            mode = 'Natural Language Only (Fallback)'
-            explanation = "No clear logical structure. Using fallback reasoning."
-        
-        # Analyze with logic reasoner
-        logic_result = st.session_state.logic_reasoner.reason(problem)
-        
-        # Calculate overall confidence
-        confidence = logic_result['confidence']
-        
+    result = analyze_with_modes(problem, ANALYSIS_MODES)
+    if result['success']:
         # Generate combined result
-        combined_result = f"""
-Analysis Mode: {mode}
-Explanation: {explanation}
+        result['combined_result'] = f"""
+Analysis Mode: {result['mode']}
+Explanation: {result['explanation']}
 
 Logic Reasoning Result:
-{logic_result['result']}
+{result['logic_result']['result']}
 
-Conclusion: {logic_result['conclusion']}
+Conclusion: {result['conclusion']}
 """
-        
-        return {
-            'success': True,
-            'mode': mode,
-            'explanation': explanation,
-            'logic_result': logic_result,
-            'combined_result': combined_result,
-            'confidence': confidence,
-            'conclusion': logic_result['conclusion'],
-            'features': logical_features
-        }
-        
-    except Exception as e:
-        logger.error(f"Error analyzing problem: {e}")
-        return {
-            'error': f"Error analyzing problem: {str(e)}",
-            'success': False
-        }
+    return result
 
 def display_mode_selection(mode: str, explanation: str, features: Dict[str, bool]):
     """Display the reasoning mode selection information."""
@@ -152,20 +149,11 @@ def display_mode_selection(mode: str, explanation: str, features: Dict[str, bool
     else:
         mode_color = "🟪"
     
-    st.markdown(f"""
-    <div class="mode-info">
-        <h4>{mode_color} Selected Mode: {mode}</h4>
-        <p><strong>Explanation:</strong> {explanation}</p>
-        <p><strong>Features Detected:</strong></p>
-        <ul>
-            <li>Logical Connectives: {'✅' if features['logical_connectives'] else '❌'}</li>
-            <li>Conditionals: {'✅' if features['conditionals'] else '❌'}</li>
-            <li>Formal Logic: {'✅' if features['formal_logic'] else '❌'}</li>
-            <li>Quantifiers: {'✅' if features['quantifiers'] else '❌'}</li>
-            <li>Questions: {'✅' if features['questions'] else '❌'}</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    marks = {name: '✅' if present else '❌' for name, present in features.items()}
+    st.markdown(
+        MODE_INFO_TEMPLATE.format(mode_color=mode_color, mode=mode, explanation=explanation, **marks),
+        unsafe_allow_html=True
+    )
 
 def display_result(result: Dict[str, Any]):
     """Display the reasoning result."""
@@ -175,12 +163,15 @@ def display_result(result: Dict[str, Any]):
     
     # Display final answer prominently
     st.markdown("### 🎯 Final Answer")
-    st.markdown(f"""
-    <div class="result-box">
-        <h3>{result['conclusion']}</h3>
-        <p><strong>Confidence:</strong> <span class="confidence-{'high' if result['confidence'] > 0.7 else 'medium' if result['confidence'] > 0.4 else 'low'}">{result['confidence']:.2f}</span></p>
-    </div>
-    """, unsafe_allow_html=True)
+    confidence_level = 'high' if result['confidence'] > 0.7 else 'medium' if result['confidence'] > 0.4 else 'low'
+    st.markdown(
+        RESULT_BOX_TEMPLATE.format(
+            conclusion=result['conclusion'],
+            confidence=result['confidence'],
+            confidence_level=confidence_level
+        ),
+        unsafe_allow_html=True
+    )
     
     # Display detailed reasoning
     st.markdown("### 📝 Detailed Reasoning")
@@ -198,7 +189,7 @@ def display_result(result: Dict[str, Any]):
             # Display truth table if available
             if result['logic_result']['truth_table']:
                 st.markdown("**Truth Table:**")
-                df = pd.DataFrame(result['logic_result']['truth_table'])
+                df = truth_table_display_frame(result['logic_result'])
                 st.dataframe(df, use_container_width=True)
         else:
             st.text("Logic analysis was not successful for this problem type.")
@@ -207,17 +198,16 @@ def display_example_problems():
     """Display example problems in the sidebar."""
     st.sidebar.markdown("### 📚 Example Problems")
     
-    # Get problems by category
-    categories = ['conditional', 'formal_logic', 'categorical']
-    
-    for category in categories:
-        st.sidebar.markdown(f"**{category.title()}:**")
-        problems = get_problems_by_category(category)
-        
-        for i, problem in enumerate(problems[:2], 1):  # Show first 2
-            if st.sidebar.button(f"{i}. {problem['problem'][:40]}...", key=f"{category}_{i}"):
-                st.session_state.problem_input = problem['problem']
-                st.rerun()
+    st.sidebar.selectbox(
+        "Load an example",
+        SIDEBAR_EXAMPLES,
+        index=None,
+        placeholder="Choose an example...",
+        format_func=SIDEBAR_EXAMPLE_LABELS.get,
+        key="example_picker",
+        on_change=load_selected_problem,
+        args=("example_picker",)
+    )
 
 def main():
     """Main Streamlit application."""
@@ -245,10 +235,13 @@ def main():
         # Processing history
         if st.session_state.processing_history:
             st.markdown("### 📊 Recent Problems")
-            for i, history_item in enumerate(st.session_state.processing_history[-5:], 1):
-                if st.button(f"{i}. {history_item['problem'][:40]}...", key=f"history_{i}"):
-                    st.session_state.problem_input = history_item['problem']
-                    st.rerun()
+            for i, history_item in enumerate(list(st.session_state.processing_history)[-5:], 1):
+                st.button(
+                    f"{i}. {history_item['problem'][:40]}...",
+                    key=f"history_{i}",
+                    on_click=load_problem,
+                    args=(history_item['problem'],)
+                )
     
     # Main interface
     st.markdown("### 💭 Enter Your Problem")
@@ -4,22 +4,34 @@ Uses requests to call Google API directly to avoid dependency conflicts
 """
 
 import streamlit as st
-import pandas as pd
 import time
-import requests
-import json
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 import logging
 
 from logic_reasoning import get_logic_reasoner
-from utils import detect_logical_keywords, validate_input
+from natural_language import REASONING_PROMPTS, call_gemini
+from reasoning_core import load_problem, load_selected_problem, truth_table_display_frame
+from utils import detect_logical_keywords, extract_conclusion, validate_input
 from sample_problems import get_all_problems, get_problems_by_category
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of analyses kept in each session's history
+HISTORY_LIMIT = 20
+
+# Sidebar examples: the first two problems of each category, selected once
+SIDEBAR_EXAMPLE_LABELS = {
+    problem['problem']: f"{category.title()}: {problem['problem'][:40]}..."
+    for category in ('conditional', 'formal_logic', 'categorical')
+    for problem in get_problems_by_category(category)[:2]
+}
+SIDEBAR_EXAMPLES = tuple(SIDEBAR_EXAMPLE_LABELS)
+
 # Page configuration
 st.set_page_config(
     page_title="Dual Modality Reasoning Agent",
@@ -68,6 +80,33 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+class GeminiAPIError(Exception):
+    """Raised when the Gemini API does not return any generated text."""
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=1000)
+def fetch_gemini_response(problem: str, api_key: str) -> str:
+    """
+    Get Gemini's analysis of a problem, memoized per problem text and key.
+    
+    Failures raise instead of returning, so st.cache_data only keeps
+    successful responses and failed calls are retried next time.
+    
+    Args:
+        problem (str): Problem to analyze
+        api_key (str): Google AI API key
+        
+    Returns:
+        str: Generated analysis text
+        
+    Raises:
+        GeminiAPIError: If the API responds without any generated text
+        RateLimitError: If the API asks the client to back off
+    """
+    content = call_gemini(REASONING_PROMPTS['logical'].format(problem=problem), api_key)
+    if not content:
+        raise GeminiAPIError("API Error: no response from Gemini")
+    return content
+
 def call_gemini_api(problem: str, api_key: str) -> Dict[str, Any]:
     """
     Call Google Gemini API using requests to avoid dependency conflicts.
@@ -80,48 +119,18 @@ def call_gemini_api(problem: str, api_key: str) -> Dict[str, Any]:
         Dict[str, Any]: API response
     """
     try:
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={api_key}"
-        
-        prompt = f"""You are a logical reasoning expert. Analyze the following problem step by step:
-
-Problem: {problem}
-
-Please provide:
-1. A clear step-by-step logical analysis
-2. Identify the logical structure (premises, conclusions, reasoning)
-3. State your final answer clearly
-4. Explain your reasoning process
-
-Be concise but thorough in your analysis."""
-
-        headers = {
-            'Content-Type': 'application/json',
-        }
-        
-        data = {
-            "contents": [{
-                "parts": [{
-                    "text": prompt
-                }]
-            }]
+        content = fetch_gemini_response(problem, api_key)
+        return {
+            'success': True,
+            'result': content,
+            'conclusion': extract_conclusion(content),
+            'confidence': 0.8
         }
         
-        response = requests.post(url, headers=headers, data=json.dumps(data), timeout=30)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if 'candidates' in result and len(result['candidates']) > 0:
-                content = result['candidates'][0]['content']['parts'][0]['text']
-                return {
-                    'success': True,
-                    'result': content,
-                    'conclusion': extract_conclusion(content),
-                    'confidence': 0.8
-                }
-        
+    except GeminiAPIError as e:
         return {
             'success': False,
-            'result': f"API Error: {response.status_code}",
+            'result': str(e),
             'conclusion': "API call failed",
             'confidence': 0.1
         }
@@ -135,39 +144,28 @@ Be concise but thorough in your analysis."""
             'confidence': 0.1
         }
 
-def extract_conclusion(text: str) -> str:
-    """Extract conclusion from Gemini response."""
-    # Look for conclusion indicators
-    conclusion_indicators = [
-        'conclusion:', 'final answer:', 'answer:', 'result:',
-        'therefore:', 'thus:', 'hence:', 'in conclusion:'
-    ]
-    
-    text_lower = text.lower()
-    for indicator in conclusion_indicators:
-        if indicator in text_lower:
-            start_idx = text_lower.find(indicator) + len(indicator)
-            remaining = text[start_idx:].strip()
-            sentences = remaining.split('.')
-            if sentences:
-                return sentences[0].strip()
-    
-    # If no clear conclusion indicator, get the last sentence
-    sentences = text.split('.')
-    if len(sentences) > 1:
-        return sentences[-2].strip() + '.'
-    
-    return text[:200] + "..." if len(text) > 200 else text
+@st.cache_resource(show_spinner=False)
+def get_reasoner():
+    """Get the logic reasoner shared by all sessions of this app."""
+    return get_logic_reasoner()
 
 def initialize_session_state():
     """Initialize session state variables."""
-    if 'logic_reasoner' not in st.session_state:
-        st.session_state.logic_reasoner = get_logic_reasoner()
     if 'processing_history' not in st.session_state:
-        st.session_state.processing_history = []
+        st.session_state.processing_history = deque(maxlen=HISTORY_LIMIT)
     if 'api_key_set' not in st.session_state:
         st.session_state.api_key_set = False
 
+@st.cache_resource(show_spinner=False)
+def get_reasoning_pool() -> ThreadPoolExecutor:
+    """
+    Get the thread pool that runs logic reasoning alongside API calls.
+    
+    Returns:
+        ThreadPoolExecutor: Pool shared by all sessions of this app
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix='logic-reasoning')
+
 def analyze_problem(problem: str, api_key: str = None) -> Dict[str, Any]:
     """
     Analyze a problem using both logic and natural language reasoning.
@@ -191,13 +189,16 @@ def analyze_problem(problem: str, api_key: str = None) -> Dict[str, Any]:
         # Detect logical features
         logical_features = detect_logical_keywords(problem)
         
-        # Run logic reasoning
-        logic_result = st.session_state.logic_reasoner.reason(problem)
-        
-        # Run natural language reasoning if API key available
+        # Run logic reasoning, in the background while the API call is in
+        # flight when there is one; both are independent of each other
+        reasoner = get_reasoner()
         nl_result = None
         if api_key:
+            logic_future = get_reasoning_pool().submit(reasoner.reason, problem)
             nl_result = call_gemini_api(problem, api_key)
+            logic_result = logic_future.result()
+        else:
+            logic_result = reasoner.reason(problem)
         
         # Determine mode and combine results
         if logical_features['formal_logic']:
@@ -210,11 +211,8 @@ def analyze_problem(problem: str, api_key: str = None) -> Dict[str, Any]:
             if logic_result['success']:
                 mode = 'Dual Mode'
                 explanation = "Using both natural language and logic reasoning."
-                combined_result = f"""Natural Language Analysis:
-{nl_result['result']}
-
-Logic Analysis:
-{logic_result['result']}"""
+                # Both halves are shown side by side, so they are not joined here
+                combined_result = None
                 confidence = (nl_result['confidence'] + logic_result['confidence']) / 2
                 conclusion = f"NL: {nl_result['conclusion']} | Logic: {logic_result['conclusion']}"
             else:
@@ -295,9 +293,10 @@ def display_result(result: Dict[str, Any]):
     st.markdown("### 📝 Detailed Reasoning")
     
     with st.expander("Show detailed analysis", expanded=True):
-        # Combined result
-        st.markdown("**Combined Analysis:**")
-        st.text_area("", value=result['combined_result'], height=200, disabled=True)
+        # Combined result (None in Dual Mode, whose halves are shown below)
+        if result['combined_result'] is not None:
+            st.markdown("**Combined Analysis:**")
+            st.text_area("", value=result['combined_result'], height=200, disabled=True)
         
         # Mode-specific results
         if result['mode'] == 'Dual Mode':
@@ -318,7 +317,7 @@ def display_result(result: Dict[str, Any]):
                     # Display truth table if available
                     if result['logic_result']['truth_table']:
                         st.markdown("**Truth Table:**")
-                        df = pd.DataFrame(result['logic_result']['truth_table'])
+                        df = truth_table_display_frame(result['logic_result'])
                         st.dataframe(df, use_container_width=True)
                 else:
                     st.text("Logic analysis failed")
@@ -338,7 +337,7 @@ def display_result(result: Dict[str, Any]):
                 # Display truth table if available
                 if result['logic_result']['truth_table']:
                     st.markdown("**Truth Table:**")
-                    df = pd.DataFrame(result['logic_result']['truth_table'])
+                    df = truth_table_display_frame(result['logic_result'])
                     st.dataframe(df, use_container_width=True)
             else:
                 st.text("Logic analysis failed")
@@ -347,17 +346,16 @@ def display_example_problems():
     """Display example problems in the sidebar."""
     st.sidebar.markdown("### 📚 Example Problems")
     
-    # Get problems by category
-    categories = ['conditional', 'formal_logic', 'categorical']
-    
-    for category in categories:
-        st.sidebar.markdown(f"**{category.title()}:**")
-        problems = get_problems_by_category(category)
-        
-        for i, problem in enumerate(problems[:2], 1):  # Show first 2
-            if st.sidebar.button(f"{i}. {problem['problem'][:40]}...", key=f"{category}_{i}"):
-                st.session_state.problem_input = problem['problem']
-                st.rerun()
+    st.sidebar.selectbox(
+        "Load an example",
+        SIDEBAR_EXAMPLES,
+        index=None,
+        placeholder="Choose an example...",
+        format_func=SIDEBAR_EXAMPLE_LABELS.get,
+        key="example_picker",
+        on_change=load_selected_problem,
+        args=("example_picker",)
+    )
 
 def main():
     """Main Streamlit application."""
@@ -406,10 +404,13 @@ def main():
         # Processing history
         if st.session_state.processing_history:
             st.markdown("### 📊 Recent Problems")
-            for i, history_item in enumerate(st.session_state.processing_history[-5:], 1):
-                if st.button(f"{i}. {history_item['problem'][:50]}...", key=f"history_{i}"):
-                    st.session_state.problem_input = history_item['problem']
-                    st.rerun()
+            for i, history_item in enumerate(list(st.session_state.processing_history)[-5:], 1):
+                st.button(
+                    f"{i}. {history_item['problem'][:50]}...",
+                    key=f"history_{i}",
+                    on_click=load_problem,
+                    args=(history_item['problem'],)
+                )
     
     # Main interface
     st.markdown("### 💭 Enter Your Problem")
@@ -432,10 +433,10 @@ def main():
                 try:
                     result = analyze_problem(problem, api_key if st.session_state.api_key_set else None)
                     
-                    # Store in history
+                    # Store in history (only what the sidebar needs, not the full result)
                     st.session_state.processing_history.append({
                         'problem': problem,
-                        'result': result,
+                        'conclusion': result.get('conclusion'),
                         'timestamp': time.time()
                     })
                     
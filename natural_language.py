@@ -4,36 +4,90 @@ Uses OpenRouter API for chain-of-thought reasoning (with fallback)
 """
 
 import os
+import re
+import functools
+import random
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 import time
+from email.utils import parsedate_to_datetime
 import requests
+from requests.adapters import HTTPAdapter
+
+from utils import extract_conclusion
 
 logger = logging.getLogger(__name__)
 
-class NaturalLanguageReasoner:
-    """Natural language reasoning powered by OpenRouter-hosted LLMs."""
+# Status codes the API uses to ask clients to slow down
+RATE_LIMIT_STATUS_CODES = (429, 503)
+MAX_BACKOFF_SECONDS = 30.0
+
+# Substrings checked in responses and fallback problems, compiled once
+_STRUCTURE_RE = re.compile('step|conclusion|therefore|thus')
+_QUESTION_WORD_RE = re.compile('is|are|can|will|do')  # 'do' also covers 'does'
+
+# Gemini endpoint used by call_gemini; the API key goes in the query string
+GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent"
+
+# (connect, read) timeouts: fail fast on unreachable hosts, allow slow generation
+REQUEST_TIMEOUT = (3.05, 30)
+
+def create_http_session() -> requests.Session:
+    """
+    Create an HTTP session that keeps API connections open for reuse.
     
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize the natural language reasoner.
-        
-        Args:
-            api_key (str, optional): OpenRouter API key. If None, tries to get from environment.
-        """
-        self.api_key = api_key or os.getenv('OPENROUTER_API_KEY')
-        self.model_name = os.getenv('OPENROUTER_MODEL', 'openrouter/auto')
-        self.base_url = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1/chat/completions')
-        self.referer = os.getenv('OPENROUTER_REFERER', 'https://openrouter.ai')
-        self.app_title = os.getenv('OPENROUTER_APP_NAME', 'Dual-Modality-Reasoning-Agent')
-        self.api_available = True if self.api_key else False
+    Reusing pooled keep-alive connections skips the TCP and TLS handshakes
+    that a bare requests.post() repeats on every call. Retries are left to
+    the callers, which handle rate limits themselves.
+    
+    Returns:
+        requests.Session: Session with pooled HTTP(S) adapters
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
-        if not self.api_available:
-            logger.warning("No OpenRouter API key found. Set OPENROUTER_API_KEY to enable NL reasoning.")
+# Shared by all reasoners; sessions are safe to use from several threads
+HTTP_SESSION = create_http_session()
+
+class RateLimitError(Exception):
+    """Raised when the API responds with a rate-limit status (429/503)."""
+    
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(f"Rate limited by API (HTTP {status_code})")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an HTTP Retry-After header into a delay in seconds.
+    
+    Args:
+        value (str, optional): Header value, either delta-seconds or an HTTP date
         
-        # Reasoning prompts
-        self.reasoning_prompts = {
-            'logical': """You are a logical reasoning expert. Analyze the following problem step by step:
+    Returns:
+        Optional[float]: Delay in seconds, or None if absent/unparseable
+    """
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+# Prompt templates by reasoning type; {problem} is replaced with the problem
+REASONING_PROMPTS = {
+    'logical': """You are a logical reasoning expert. Analyze the following problem step by step:
 
 Problem: {problem}
 
@@ -45,7 +99,7 @@ Please provide:
 
 Be concise but thorough in your analysis.""",
 
-            'general': """You are a reasoning expert. Analyze the following problem step by step:
+    'general': """You are a reasoning expert. Analyze the following problem step by step:
 
 Problem: {problem}
 
@@ -58,13 +112,106 @@ Please provide:
 
 Be concise but thorough in your analysis.""",
 
-            'fallback': """Analyze this problem and provide a clear answer with reasoning:
+    'fallback': """Analyze this problem and provide a clear answer with reasoning:
 
 {problem}
 
 Please give a step-by-step explanation and your final conclusion."""
+}
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Pick the delay before retrying a failed request.
+    
+    Exponential backoff with up to a second of random jitter, so clients
+    that failed together do not all retry at the same moment.
+    
+    Args:
+        attempt (int): Zero-based number of the attempt that just failed
+        
+    Returns:
+        float: Delay in seconds, at most MAX_BACKOFF_SECONDS
+    """
+    return min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+
+def call_gemini(prompt: str, api_key: str) -> Optional[str]:
+    """
+    Call the Google Gemini generateContent endpoint.
+    
+    Uses the same HTTP session, timeouts and rate-limit signalling as the
+    OpenRouter calls of NaturalLanguageReasoner.
+    
+    Args:
+        prompt (str): Prompt to send
+        api_key (str): Google AI API key
+        
+    Returns:
+        Optional[str]: Response text or None
+        
+    Raises:
+        RateLimitError: If the API asks the client to back off
+    """
+    payload = {"contents": [{"parts": [{"text": prompt}]}]}
+    response = HTTP_SESSION.post(GEMINI_URL, params={"key": api_key}, json=payload, timeout=REQUEST_TIMEOUT)
+    if response.status_code in RATE_LIMIT_STATUS_CODES:
+        raise RateLimitError(response.status_code, parse_retry_after(response.headers.get('Retry-After')))
+    if response.status_code != 200:
+        logger.error(
+            "Gemini API returned %s: %s",
+            response.status_code,
+            response.text[:200],
+        )
+        return None
+
+    candidates = response.json().get("candidates")
+    if not candidates:
+        return None
+
+    return candidates[0]["content"]["parts"][0]["text"]
+
+class NaturalLanguageReasoner:
+    """Natural language reasoning powered by OpenRouter-hosted LLMs."""
+    
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize the natural language reasoner.
+        
+        Args:
+            api_key (str, optional): OpenRouter API key. If None, tries to get from environment.
+        """
+        self.api_key = api_key or os.getenv('OPENROUTER_API_KEY')
+        self.model_name = os.getenv('OPENROUTER_MODEL', 'openrouter/auto')
+        self.base_url = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1/chat/completions')
+        self.referer = os.getenv('OPENROUTER_REFERER', 'https://openrouter.ai')
+        self.app_title = os.getenv('OPENROUTER_APP_NAME', 'Dual-Modality-Reasoning-Agent')
+        self.api_available = True if self.api_key else False
+
+        if not self.api_available:
+            logger.warning("No OpenRouter API key found. Set OPENROUTER_API_KEY to enable NL reasoning.")
+        
+        # Reasoning prompts
+        self.reasoning_prompts = dict(REASONING_PROMPTS)
+        
+        # Text before and after {problem} in each prompt, split once here
+        self._prompt_parts = {
+            kind: template.partition('{problem}')[::2]
+            for kind, template in self.reasoning_prompts.items()
         }
     
+    def _format_prompt(self, problem: str, reasoning_type: str) -> str:
+        """
+        Fill a reasoning prompt with the problem.
+        
+        Args:
+            problem (str): The problem to analyze
+            reasoning_type (str): Prompt kind; unknown kinds use 'fallback'
+            
+        Returns:
+            str: Prompt to send to the model
+        """
+        before, after = self._prompt_parts.get(reasoning_type) or self._prompt_parts['fallback']
+        return f"{before}{problem}{after}"
+    
     def reason(self, problem: str, reasoning_type: str = 'general') -> Dict[str, Any]:
         """
         Perform natural language reasoning on the given problem.
@@ -80,24 +227,28 @@ Please give a step-by-step explanation and your final conclusion."""
             return self._fallback_reasoning(problem)
         
         try:
-            prompt = self.reasoning_prompts.get(reasoning_type, self.reasoning_prompts['fallback'])
-            formatted_prompt = prompt.format(problem=problem)
+            formatted_prompt = self._format_prompt(problem, reasoning_type)
             
             # Generate response with retry logic
             max_retries = 3
             for attempt in range(max_retries):
+                delay = None
                 try:
                     response_text = self._call_openrouter(formatted_prompt)
                     if response_text:
                         return self._process_response(response_text, reasoning_type)
                     logger.warning(f"Empty response from OpenRouter (attempt {attempt + 1})")
+                except RateLimitError as e:
+                    # Honour the server's Retry-After, else back off exponentially
+                    delay = e.retry_after
+                    logger.warning(f"{e} (attempt {attempt + 1})")
                 except Exception as e:
                     logger.error(f"Error calling OpenRouter API (attempt {attempt + 1}): {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2)
-                    continue
                 
-                time.sleep(1)
+                if attempt < max_retries - 1:
+                    delay = min(MAX_BACKOFF_SECONDS, backoff_delay(attempt) if delay is None else delay)
+                    logger.info(f"Retrying OpenRouter request in {delay:.1f}s")
+                    time.sleep(delay)
             
             # If all retries failed, use fallback
             return self._fallback_reasoning(problem)
@@ -106,6 +257,40 @@ Please give a step-by-step explanation and your final conclusion."""
             logger.error(f"Error in natural language reasoning: {e}")
             return self._fallback_reasoning(problem)
     
+    def reason_batch(self, problems: List[str], reasoning_type: str = 'general',
+                     max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Perform natural language reasoning on several problems concurrently.
+        
+        The chat completions endpoint takes one conversation per request, so the
+        requests are overlapped on a bounded thread pool instead. Identical
+        problems are only sent once.
+        
+        Args:
+            problems (List[str]): Problems to analyze
+            reasoning_type (str): Type of reasoning ('logical', 'general', 'fallback')
+            max_workers (int): Maximum number of requests in flight
+            
+        Returns:
+            List[Dict[str, Any]]: One result per problem, in input order
+        """
+        unique = list(dict.fromkeys(problems))
+        if not self.api_available or len(unique) <= 1:
+            results = {problem: self.reason(problem, reasoning_type) for problem in unique}
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as pool:
+                futures = {problem: pool.submit(self.reason, problem, reasoning_type) for problem in unique}
+                results = {problem: future.result() for problem, future in futures.items()}
+        
+        # Duplicates get their own copy so callers can mutate results freely
+        seen = set()
+        batch = []
+        for problem in problems:
+            result = results[problem]
+            batch.append(dict(result) if problem in seen else result)
+            seen.add(problem)
+        return batch
+    
     def _process_response(self, response_text: str, reasoning_type: str) -> Dict[str, Any]:
         """
         Process the response from the LLM.
@@ -121,7 +306,7 @@ Please give a step-by-step explanation and your final conclusion."""
         cleaned_response = response_text.strip()
         
         # Extract conclusion if possible
-        conclusion = self._extract_conclusion(cleaned_response)
+        conclusion = extract_conclusion(cleaned_response)
         
         # Calculate confidence based on response quality
         confidence = self._calculate_confidence(cleaned_response, reasoning_type)
@@ -134,40 +319,6 @@ Please give a step-by-step explanation and your final conclusion."""
             'success': True
         }
     
-    def _extract_conclusion(self, response: str) -> str:
-        """
-        Extract the main conclusion from the response.
-        
-        Args:
-            response (str): Full response text
-            
-        Returns:
-            str: Extracted conclusion
-        """
-        # Look for conclusion indicators
-        conclusion_indicators = [
-            'conclusion:', 'final answer:', 'answer:', 'result:',
-            'therefore:', 'thus:', 'hence:', 'in conclusion:'
-        ]
-        
-        response_lower = response.lower()
-        for indicator in conclusion_indicators:
-            if indicator in response_lower:
-                # Find the sentence after the indicator
-                start_idx = response_lower.find(indicator) + len(indicator)
-                remaining = response[start_idx:].strip()
-                # Get the first sentence
-                sentences = remaining.split('.')
-                if sentences:
-                    return sentences[0].strip()
-        
-        # If no clear conclusion indicator, try to get the last sentence
-        sentences = response.split('.')
-        if len(sentences) > 1:
-            return sentences[-2].strip() + '.'
-        
-        return response[:200] + "..." if len(response) > 200 else response
-    
     def _calculate_confidence(self, response: str, reasoning_type: str) -> float:
         """
         Calculate confidence score based on response quality.
@@ -188,7 +339,7 @@ Please give a step-by-step explanation and your final conclusion."""
             base_confidence -= 0.2
         
         # Structure factor (look for numbered steps, conclusions, etc.)
-        if any(indicator in response.lower() for indicator in ['step', 'conclusion', 'therefore', 'thus']):
+        if _STRUCTURE_RE.search(response.lower()) is not None:
             base_confidence += 0.1
         
         # Reasoning type factor
@@ -206,6 +357,9 @@ Please give a step-by-step explanation and your final conclusion."""
         
         Returns:
             Optional[str]: Response text or None
+            
+        Raises:
+            RateLimitError: If the API asks the client to back off
         """
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -233,7 +387,9 @@ Please give a step-by-step explanation and your final conclusion."""
             "top_p": 0.9,
         }
 
-        response = requests.post(self.base_url, headers=headers, json=payload, timeout=30)
+        response = HTTP_SESSION.post(self.base_url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+        if response.status_code in RATE_LIMIT_STATUS_CODES:
+            raise RateLimitError(response.status_code, parse_retry_after(response.headers.get('Retry-After')))
         if response.status_code != 200:
             logger.error(
                 "OpenRouter API returned %s: %s",
@@ -275,7 +431,7 @@ Please give a step-by-step explanation and your final conclusion."""
             }
         
         # Check for questions
-        if any(q_word in problem_lower for q_word in ['is', 'are', 'can', 'will', 'does', 'do']):
+        if _QUESTION_WORD_RE.search(problem_lower) is not None:
             return {
                 'result': f"The problem appears to be a question: '{problem}'. This requires detailed analysis which I cannot provide without the reasoning model.",
                 'conclusion': "Question format detected - requires reasoning analysis",
@@ -293,9 +449,13 @@ Please give a step-by-step explanation and your final conclusion."""
             'success': False
         }
 
+@functools.lru_cache(maxsize=None)
 def get_natural_language_reasoner(api_key: Optional[str] = None) -> NaturalLanguageReasoner:
     """
-    Factory function to create a natural language reasoner.
+    Get the process-wide natural language reasoner for an API key.
+    
+    Reasoners are stateless apart from their configuration, which is read
+    from the environment when the first one for a key is created.
     
     Args:
         api_key (str, optional): OpenRouter API key
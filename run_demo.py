@@ -5,12 +5,31 @@ Runs the system without external API dependencies
 
 import sys
 import os
+import atexit
 import logging
+import functools
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging; the scripts report progress with print, so only
+# warnings and errors from the modules under test are shown
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Problems entered in the interactive demo, kept between runs
+HISTORY_FILE = os.path.expanduser('~/.truemot_history')
+
+@functools.lru_cache(maxsize=None)
+def get_reasoner():
+    """
+    Get the logic reasoner shared by the demo steps.
+    
+    Imported on first use so that the demo starts without loading SymPy.
+    
+    Returns:
+        LogicReasoner: Reasoner instance
+    """
+    from logic_reasoning import get_logic_reasoner
+    return get_logic_reasoner()
+
 def test_core_functionality():
     """Test core functionality without external APIs."""
     print("🧪 Testing Core Functionality")
@@ -20,13 +39,12 @@ def test_core_functionality():
         # Test imports
         print("Testing imports...")
         from utils import detect_logical_keywords, validate_input
-        from logic_reasoning import get_logic_reasoner
         from sample_problems import get_all_problems
+        reasoner = get_reasoner()
         print("✅ All core modules imported successfully")
         
         # Test logic reasoning
         print("\nTesting logic reasoning...")
-        reasoner = get_logic_reasoner()
         
         test_cases = [
             "If A then B",
@@ -36,12 +54,16 @@ def test_core_functionality():
         ]
         
         for i, test_case in enumerate(test_cases, 1):
-            print(f"  Test {i}: {test_case}")
             result = reasoner.reason(test_case)
-            print(f"    Success: {result['success']}")
-            print(f"    Confidence: {result['confidence']:.2f}")
+            # One write per test case instead of one per line
+            lines = [
+                f"  Test {i}: {test_case}",
+                f"    Success: {result['success']}",
+                f"    Confidence: {result['confidence']:.2f}"
+            ]
             if result['truth_table']:
-                print(f"    Truth table generated: {len(result['truth_table'])} rows")
+                lines.append(f"    Truth table generated: {len(result['truth_table'])} rows")
+            print("\n".join(lines))
         
         # Test sample problems
         print("\nTesting sample problems...")
@@ -65,16 +87,54 @@ def test_core_functionality():
         print(f"❌ Core functionality test failed: {e}")
         return False
 
+def setup_line_editing():
+    """
+    Enable input history and tab completion of sample problems, where available.
+    
+    Uses readline, which is not available on every platform; without it the
+    demo falls back to plain input().
+    """
+    try:
+        import readline
+    except ImportError:
+        return
+    
+    from sample_problems import get_all_problems
+    
+    completions = tuple(problem['problem'] for problem in get_all_problems())
+    
+    def complete(text, state):
+        matches = [problem for problem in completions if problem.startswith(text)]
+        return matches[state] if state < len(matches) else None
+    
+    # Complete whole problems, not single words
+    readline.set_completer_delims('')
+    readline.set_completer(complete)
+    readline.parse_and_bind('tab: complete')
+    
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    
+    def save_history():
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError as e:
+            logger.warning(f"Could not save demo history to {HISTORY_FILE}: {e}")
+    
+    atexit.register(save_history)
+
 def run_interactive_demo():
     """Run an interactive demo of the system."""
     print("\n🎮 Interactive Demo")
     print("=" * 30)
     
     try:
-        from logic_reasoning import get_logic_reasoner
         from utils import detect_logical_keywords
         
-        reasoner = get_logic_reasoner()
+        reasoner = get_reasoner()
+        setup_line_editing()
         
         print("Enter logical problems to analyze (type 'quit' to exit):")
         print("Examples:")
@@ -93,28 +153,30 @@ def run_interactive_demo():
                 if not problem:
                     continue
                 
-                print(f"\nAnalyzing: {problem}")
-                
                 # Detect logical features
                 features = detect_logical_keywords(problem)
-                print(f"Features detected: {features}")
+                print(f"\nAnalyzing: {problem}\nFeatures detected: {features}")
                 
                 # Analyze with logic reasoner
                 result = reasoner.reason(problem)
                 
-                print(f"Success: {result['success']}")
-                print(f"Confidence: {result['confidence']:.2f}")
-                print(f"Result: {result['result']}")
-                print(f"Conclusion: {result['conclusion']}")
+                # Collect the report and write it in one go
+                lines = [
+                    f"Success: {result['success']}",
+                    f"Confidence: {result['confidence']:.2f}",
+                    f"Result: {result['result']}",
+                    f"Conclusion: {result['conclusion']}"
+                ]
                 
                 if result['truth_table']:
-                    print(f"Truth table ({len(result['truth_table'])} rows):")
+                    lines.append(f"Truth table ({len(result['truth_table'])} rows):")
                     for i, row in enumerate(result['truth_table'][:5]):  # Show first 5 rows
-                        print(f"  {i+1}: {row}")
+                        lines.append(f"  {i+1}: {row}")
                     if len(result['truth_table']) > 5:
-                        print(f"  ... and {len(result['truth_table']) - 5} more rows")
+                        lines.append(f"  ... and {len(result['truth_table']) - 5} more rows")
                 
-                print("-" * 50)
+                lines.append("-" * 50)
+                print("\n".join(lines), flush=True)
                 
             except KeyboardInterrupt:
                 break
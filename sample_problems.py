@@ -3,6 +3,13 @@ Sample Problems for Dual Modality Reasoning Agent
 Collection of test problems for different reasoning types
 """
 
+import sys
+import copy
+import random
+import functools
+import itertools
+from collections import Counter
+
 # Sample problems organized by category and difficulty
 SAMPLE_PROBLEMS = {
     'conditional': [
@@ -144,6 +151,62 @@ SAMPLE_PROBLEMS = {
     ]
 }
 
+def _intern_problem(problem: dict) -> dict:
+    """
+    Copy a problem for the shared views below.
+    
+    Args:
+        problem (dict): Problem from SAMPLE_PROBLEMS
+        
+    Returns:
+        dict: Problem with its (often repeated) strings interned
+    """
+    return {key: sys.intern(value) for key, value in problem.items()}
+
+def _copy_problems(problems: tuple) -> list:
+    """
+    Copy shared problems so callers can modify (or serialize) them freely.
+    
+    Args:
+        problems (tuple): Problems from the shared views below
+        
+    Returns:
+        list: Plain dictionary copies of the problems
+    """
+    return [dict(problem) for problem in problems]
+
+# Views derived once from SAMPLE_PROBLEMS; the problem set is fixed at import,
+# and the getters hand out copies of these shared problems
+_BY_CATEGORY = {
+    category: tuple(_intern_problem(problem) for problem in problems)
+    for category, problems in SAMPLE_PROBLEMS.items()
+}
+_ALL_PROBLEMS = tuple(itertools.chain.from_iterable(_BY_CATEGORY.values()))
+_STATS = {
+    category: {
+        'count': len(problems),
+        'difficulties': dict(Counter(problem['difficulty'] for problem in problems))
+    }
+    for category, problems in SAMPLE_PROBLEMS.items()
+}
+
+@functools.lru_cache(maxsize=None)
+def _filtered_problems(category: str = None, difficulty: str = None) -> tuple:
+    """
+    Get the problems matching a category and difficulty filter.
+    
+    Args:
+        category (str, optional): Problem category to filter by
+        difficulty (str, optional): Difficulty level to filter by
+        
+    Returns:
+        tuple: Matching problems
+    """
+    problems = _BY_CATEGORY.get(category, _ALL_PROBLEMS) if category else _ALL_PROBLEMS
+    if difficulty:
+        problems = [p for p in problems if p['difficulty'] == difficulty]
+    return tuple(problems)
+
 def get_random_problem(category: str = None, difficulty: str = None):
     """
     Get a random problem from the sample problems.
@@ -155,21 +218,10 @@ def get_random_problem(category: str = None, difficulty: str = None):
     Returns:
         dict: Random problem
     """
-    import random
-    
-    if category and category in SAMPLE_PROBLEMS:
-        problems = SAMPLE_PROBLEMS[category]
-    else:
-        # Get all problems
-        problems = []
-        for cat_problems in SAMPLE_PROBLEMS.values():
-            problems.extend(cat_problems)
-    
-    if difficulty:
-        problems = [p for p in problems if p['difficulty'] == difficulty]
+    problems = _filtered_problems(category, difficulty)
     
     if problems:
-        return random.choice(problems)
+        return dict(random.choice(problems))
     else:
         return None
 
@@ -181,21 +233,18 @@ def get_problems_by_category(category: str):
         category (str): Problem category
         
     Returns:
-        list: List of problems in the category
+        list: List of problems in the category (empty if unknown)
     """
-    return SAMPLE_PROBLEMS.get(category, [])
+    return _copy_problems(_BY_CATEGORY.get(category, ()))
 
 def get_all_problems():
     """
     Get all sample problems.
     
     Returns:
-        list: List of all problems
+        list: List of all problems, in category order
     """
-    all_problems = []
-    for problems in SAMPLE_PROBLEMS.values():
-        all_problems.extend(problems)
-    return all_problems
+    return _copy_problems(_ALL_PROBLEMS)
 
 def get_problem_statistics():
     """
@@ -204,21 +253,7 @@ def get_problem_statistics():
     Returns:
         dict: Problem statistics
     """
-    stats = {}
-    
-    for category, problems in SAMPLE_PROBLEMS.items():
-        stats[category] = {
-            'count': len(problems),
-            'difficulties': {}
-        }
-        
-        for problem in problems:
-            difficulty = problem['difficulty']
-            if difficulty not in stats[category]['difficulties']:
-                stats[category]['difficulties'][difficulty] = 0
-            stats[category]['difficulties'][difficulty] += 1
-    
-    return stats
+    return copy.deepcopy(_STATS)
 
 if __name__ == "__main__":
     # Display sample problems and statistics
@@ -5,6 +5,7 @@ Setup script for Dual Modality Reasoning Agent
 import subprocess
 import sys
 import os
+import importlib.util
 
 def install_requirements():
     """Install required packages."""
@@ -17,6 +18,22 @@ def install_requirements():
         print(f"❌ Error installing requirements: {e}")
         return False
 
+def is_installed(package: str) -> bool:
+    """
+    Check whether a package can be imported, without importing it.
+    
+    Args:
+        package (str): Module name, possibly dotted
+        
+    Returns:
+        bool: True if the module is found
+    """
+    try:
+        return importlib.util.find_spec(package) is not None
+    except ImportError:
+        # A dotted name whose parent package is missing
+        return False
+
 def check_dependencies():
     """Check if all dependencies are available."""
     print("Checking dependencies...")
@@ -36,19 +53,19 @@ def check_dependencies():
     missing_required = []
     missing_optional = []
     
+    # Look the packages up rather than importing them, which would run their
+    # (slow) initialization just to report that they are there
     for package in required_packages:
-        try:
-            __import__(package)
+        if is_installed(package):
             print(f"✅ {package}")
-        except ImportError:
+        else:
             print(f"❌ {package} (required)")
             missing_required.append(package)
     
     for package in optional_packages:
-        try:
-            __import__(package)
+        if is_installed(package):
             print(f"✅ {package} (optional)")
-        except ImportError:
+        else:
             print(f"⚠️  {package} (optional - for Google Gemini API)")
             missing_optional.append(package)
     
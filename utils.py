@@ -3,53 +3,184 @@ Utility functions for the Dual Modality Reasoning Agent
 """
 
 import re
-from typing import List, Dict, Any
+import sys
+import functools
+from enum import IntFlag
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import logging
+import numpy as np
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def detect_logical_keywords(text: str) -> Dict[str, bool]:
+def _compile_keywords(keywords: List[str]) -> 're.Pattern':
+    """
+    Compile keywords into one pattern that matches wherever any of them occurs.
+    
+    Keywords containing another keyword (e.g. 'only if' and 'if') can never be
+    the only match, so they are left out of the alternation.
+    
+    Args:
+        keywords (List[str]): Lowercase substrings to look for
+        
+    Returns:
+        re.Pattern: Pattern whose search() succeeds iff some keyword is a substring
+    """
+    needed = [
+        keyword for keyword in keywords
+        if not any(other != keyword and other in keyword for other in keywords)
+    ]
+    return re.compile('|'.join(re.escape(keyword) for keyword in needed))
+
+# Keyword patterns used by detect_logical_keywords, compiled once at import.
+# Quantifier words also count as connectives, so they are searched for once
+# and the other two patterns only hold each category's remaining keywords.
+_SHARED_QUANTIFIER_RE = _compile_keywords([
+    'all', 'some', 'every', 'any', 'none'
+])
+_CONNECTIVE_RE = _compile_keywords([
+    'if', 'then', 'implies', 'therefore', 'thus', 'hence', 'consequently',
+    'not all', 'some not',
+    'and', 'or', 'not', 'but', 'however', 'although', 'unless',
+    'only if', 'if and only if', 'necessary', 'sufficient'
+])
+_QUANTIFIER_RE = _compile_keywords([
+    'most', 'few', 'many'
+])
+_CONDITIONAL_RE = _compile_keywords([
+    'if ', 'when ', 'unless ', 'provided that', 'given that'
+])
+_QUESTION_RE = _compile_keywords([
+    'is ', 'are ', 'can ', 'will ', 'does ', 'do ', 'what ', 'how ',
+    'why ', 'which ', 'who ', 'where ', 'when '
+])
+# Reasoning modes. Interned, so comparisons between modes that come from
+# these constants succeed on the identity check in str.__eq__
+MODE_NL_ONLY = sys.intern('Natural Language Only')
+MODE_LOGIC_ONLY = sys.intern('Logic Only')
+MODE_DUAL = sys.intern('Dual Mode')
+
+# Formal logic symbols looked for by detect_logical_keywords
+_FORMAL_LOGIC_SYMBOLS = frozenset('→∧∨¬⊃≡∀∃⊢⊨')
+# Propositional variables (single capital letters) for parse_propositional_logic
+_VARIABLE_RE = re.compile(r'\b[A-Z]\b')
+# (operator, symbol, lowercase keyword) looked for by parse_propositional_logic
+_OPERATOR_MARKERS = (
+    ('implication', '→', 'implies'),
+    ('conjunction', '∧', 'and'),
+    ('disjunction', '∨', 'or'),
+    ('negation', '¬', 'not'),
+    ('biconditional', '≡', 'iff'),
+)
+
+# Phrases that introduce a conclusion in a model response, most preferred first
+CONCLUSION_INDICATORS = (
+    'conclusion:', 'final answer:', 'answer:', 'result:',
+    'therefore:', 'thus:', 'hence:', 'in conclusion:'
+)
+# Longest first, so an occurrence such as 'in conclusion:' is matched whole
+_CONCLUSION_RE = re.compile('|'.join(
+    re.escape(indicator) for indicator in sorted(CONCLUSION_INDICATORS, key=len, reverse=True)
+))
+# Preference rank of each phrase the pattern can match. A phrase ending in a
+# more preferred indicator (e.g. 'in conclusion:' and 'conclusion:') takes
+# that indicator's rank, since both end at the same place in the text.
+_CONCLUSION_RANK = {
+    phrase: min(rank for rank, indicator in enumerate(CONCLUSION_INDICATORS) if phrase.endswith(indicator))
+    for phrase in CONCLUSION_INDICATORS
+}
+
+class LogicFeatures(IntFlag):
+    """Bitmask form of the feature dictionary from detect_logical_keywords."""
+    FORMAL_LOGIC = 1
+    LOGICAL_CONNECTIVES = 2
+    CONDITIONALS = 4
+    QUANTIFIERS = 8
+    QUESTIONS = 16
+    
+    @classmethod
+    def from_features(cls, features: Dict[str, bool]) -> 'LogicFeatures':
+        """
+        Pack a feature dictionary into a bitmask.
+        
+        Args:
+            features (Dict[str, bool]): Result of detect_logical_keywords
+            
+        Returns:
+            LogicFeatures: Flags for every feature that is present
+        """
+        flags = cls(0)
+        for flag in cls:
+            if features[flag.name.lower()]:
+                flags |= flag
+        return flags
+
+def detect_logical_keywords(text: str, text_lower: Optional[str] = None) -> Dict[str, bool]:
     """
     Detect logical keywords in the input text to determine reasoning approach.
     
     Args:
         text (str): Input problem text
+        text_lower (str, optional): text.lower(), if the caller already has it
         
     Returns:
         Dict[str, bool]: Dictionary indicating presence of logical constructs
     """
-    text_lower = text.lower()
+    return dict(_detect_logical_keywords(text, text_lower))
+
+@functools.lru_cache(maxsize=1024)
+def detect_logical_flags(text: str, text_lower: Optional[str] = None) -> LogicFeatures:
+    """
+    Detect logical keywords in the input text, as a bitmask.
+    
+    Same detection as detect_logical_keywords(), for callers that only test
+    flags; the (immutable) result is memoized and returned as is.
+    
+    Args:
+        text (str): Input problem text
+        text_lower (str, optional): text.lower(), if the caller already has it
+        
+    Returns:
+        LogicFeatures: Flags for every construct that is present
+    """
+    return LogicFeatures.from_features(_detect_logical_keywords(text, text_lower))
+
+@functools.lru_cache(maxsize=1024)
+def _detect_logical_keywords(text: str, text_lower: Optional[str]) -> Dict[str, bool]:
+    """
+    Uncached implementation of detect_logical_keywords().
+    
+    The same problem text flows through validation, mode selection and the
+    apps, so results are memoized; callers get a copy, never this dict.
+    
+    Args:
+        text (str): Input problem text
+        text_lower (str, optional): text.lower(), if the caller already has it
+        
+    Returns:
+        Dict[str, bool]: Dictionary indicating presence of logical constructs
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Quantifier words, which are logical connectives too
+    shared_quantifiers = _SHARED_QUANTIFIER_RE.search(text_lower) is not None
     
     # Logical connectives
-    logical_connectives = any(keyword in text_lower for keyword in [
-        'if', 'then', 'implies', 'therefore', 'thus', 'hence', 'consequently',
-        'all', 'some', 'every', 'any', 'none', 'not all', 'some not',
-        'and', 'or', 'not', 'but', 'however', 'although', 'unless',
-        'only if', 'if and only if', 'necessary', 'sufficient'
-    ])
+    logical_connectives = shared_quantifiers or _CONNECTIVE_RE.search(text_lower) is not None
     
     # Quantifiers
-    quantifiers = any(keyword in text_lower for keyword in [
-        'all', 'some', 'every', 'any', 'none', 'most', 'few', 'many'
-    ])
+    quantifiers = shared_quantifiers or _QUANTIFIER_RE.search(text_lower) is not None
     
     # Conditional statements
-    conditionals = any(pattern in text_lower for pattern in [
-        'if ', 'when ', 'unless ', 'provided that', 'given that'
-    ])
+    conditionals = _CONDITIONAL_RE.search(text_lower) is not None
     
-    # Formal logic symbols
-    formal_logic = any(symbol in text for symbol in [
-        '→', '∧', '∨', '¬', '⊃', '≡', '∀', '∃', '⊢', '⊨'
-    ])
+    # Formal logic symbols (single characters, so one pass over the text)
+    formal_logic = not _FORMAL_LOGIC_SYMBOLS.isdisjoint(text)
     
     # Question patterns
-    questions = any(pattern in text_lower for pattern in [
-        'is ', 'are ', 'can ', 'will ', 'does ', 'do ', 'what ', 'how ',
-        'why ', 'which ', 'who ', 'where ', 'when '
-    ])
+    questions = _QUESTION_RE.search(text_lower) is not None
     
     return {
         'logical_connectives': logical_connectives,
@@ -59,6 +190,57 @@ def detect_logical_keywords(text: str) -> Dict[str, bool]:
         'questions': questions
     }
 
+def extract_conclusion(text: str) -> str:
+    """
+    Extract the main conclusion from a reasoning response.
+    
+    Takes the first sentence after the most preferred conclusion indicator,
+    else the last complete sentence, else (a prefix of) the whole text.
+    
+    Args:
+        text (str): Full response text
+        
+    Returns:
+        str: Extracted conclusion
+    """
+    # One scan finds every indicator; keep the first occurrence of the best one
+    best = None
+    for match in _CONCLUSION_RE.finditer(text.lower()):
+        rank = _CONCLUSION_RANK[match.group()]
+        if best is None or rank < best[0]:
+            best = (rank, match.end())
+            if rank == 0:
+                break
+    
+    if best is not None:
+        # Get the first sentence after the indicator
+        return text[best[1]:].strip().partition('.')[0].strip()
+    
+    # If no clear conclusion indicator, try to get the last sentence
+    head, separator, _ = text.rpartition('.')
+    if separator:
+        return head.rpartition('.')[2].strip() + '.'
+    
+    return text[:200] + "..." if len(text) > 200 else text
+
+def _stripped_shorter_than(text: str, limit: int) -> bool:
+    """
+    Check len(text.strip()) < limit, stripping (i.e. copying) text only if needed.
+    
+    Args:
+        text (str): Text to measure
+        limit (int): Length to compare against
+        
+    Returns:
+        bool: True if the text without surrounding whitespace is shorter than limit
+    """
+    if len(text) < limit:
+        return True
+    # Only text with leading or trailing whitespace gets shorter when stripped
+    if not (text[0].isspace() or text[-1].isspace()):
+        return False
+    return len(text.strip()) < limit
+
 def calculate_confidence_score(
     nl_result: str,
     logic_result: str,
@@ -77,23 +259,49 @@ def calculate_confidence_score(
     Returns:
         float: Confidence score between 0.0 and 1.0
     """
-    base_confidence = 0.5
+    # Bonuses for agreement and consistency, penalties for empty or very
+    # short results; booleans count as 0/1, so the score needs no branches
+    base_confidence = (
+        0.5
+        + 0.3 * bool(mode_agreement)
+        + 0.2 * bool(internal_consistency)
+        - 0.2 * _stripped_shorter_than(nl_result, 10)
+        - 0.1 * _stripped_shorter_than(logic_result, 5)
+    )
     
-    # Mode agreement bonus
-    if mode_agreement:
-        base_confidence += 0.3
-    
-    # Internal consistency bonus
-    if internal_consistency:
-        base_confidence += 0.2
+    return max(0.0, min(1.0, base_confidence))
+
+def calculate_confidence_scores(
+    nl_results: Sequence[str],
+    logic_results: Sequence[str],
+    mode_agreements: Sequence[bool],
+    internal_consistencies: Sequence[bool]
+) -> np.ndarray:
+    """
+    Calculate calculate_confidence_score() for many results at once.
     
-    # Penalty for empty or very short results
-    if len(nl_result.strip()) < 10:
-        base_confidence -= 0.2
-    if len(logic_result.strip()) < 5:
-        base_confidence -= 0.1
+    Args:
+        nl_results (Sequence[str]): Natural language reasoning results
+        logic_results (Sequence[str]): Logic reasoning results
+        mode_agreements (Sequence[bool]): Whether both modes agree, per result
+        internal_consistencies (Sequence[bool]): Whether internal logic is consistent, per result
+        
+    Returns:
+        np.ndarray: Confidence scores between 0.0 and 1.0
+    """
+    count = len(nl_results)
+    short_nl = np.fromiter((_stripped_shorter_than(text, 10) for text in nl_results), dtype=bool, count=count)
+    short_logic = np.fromiter((_stripped_shorter_than(text, 5) for text in logic_results), dtype=bool, count=count)
     
-    return max(0.0, min(1.0, base_confidence))
+    # Same terms, in the same order, as calculate_confidence_score
+    scores = (
+        0.5
+        + 0.3 * np.asarray(mode_agreements, dtype=bool)
+        + 0.2 * np.asarray(internal_consistencies, dtype=bool)
+        - 0.2 * short_nl
+        - 0.1 * short_logic
+    )
+    return np.clip(scores, 0.0, 1.0, out=scores)
 
 def parse_propositional_logic(statement: str) -> Dict[str, Any]:
     """
@@ -103,25 +311,37 @@ def parse_propositional_logic(statement: str) -> Dict[str, Any]:
         statement (str): Logical statement to parse
         
     Returns:
-        Dict[str, Any]: Parsed components
+        Dict[str, Any]: Parsed components (variables in alphabetical order)
+    """
+    variables, operators, complexity = _parse_propositional_logic(statement)
+    return {
+        'variables': list(variables),
+        'operators': dict(operators),
+        'complexity': complexity
+    }
+
+@functools.lru_cache(maxsize=1024)
+def _parse_propositional_logic(statement: str) -> Tuple[Tuple[str, ...], Dict[str, bool], int]:
+    """
+    Uncached implementation of parse_propositional_logic(), memoized per statement.
+    
+    Args:
+        statement (str): Logical statement to parse
+        
+    Returns:
+        Tuple[Tuple[str, ...], Dict[str, bool], int]: Variables (sorted), operators and complexity
     """
     # Extract variables (single letters, typically A-Z)
-    variables = re.findall(r'\b[A-Z]\b', statement)
+    variables = _VARIABLE_RE.findall(statement)
     
-    # Check for logical operators
+    # Check for logical operators (lowercasing the statement only once)
+    statement_lower = statement.lower()
     operators = {
-        'implication': '→' in statement or 'implies' in statement.lower(),
-        'conjunction': '∧' in statement or 'and' in statement.lower(),
-        'disjunction': '∨' in statement or 'or' in statement.lower(),
-        'negation': '¬' in statement or 'not' in statement.lower(),
-        'biconditional': '≡' in statement or 'iff' in statement.lower()
+        name: symbol in statement or keyword in statement_lower
+        for name, symbol, keyword in _OPERATOR_MARKERS
     }
     
-    return {
-        'variables': list(set(variables)),
-        'operators': operators,
-        'complexity': len(variables) + sum(operators.values())
-    }
+    return tuple(sorted(set(variables))), operators, len(variables) + sum(operators.values())
 
 def format_reasoning_output(
     mode_selection: str,
@@ -161,11 +381,11 @@ def combine_results(nl_result: str, logic_result: str, mode: str) -> str:
     Returns:
         str: Combined result
     """
-    if mode == "Natural Language Only":
+    if mode == MODE_NL_ONLY:
         return nl_result
-    elif mode == "Logic Only":
+    elif mode == MODE_LOGIC_ONLY:
         return logic_result
-    elif mode == "Dual Mode":
+    elif mode == MODE_DUAL:
         if nl_result and logic_result:
             return f"Both reasoning approaches lead to the same conclusion: {nl_result}"
         elif nl_result:
@@ -187,7 +407,20 @@ def validate_input(text: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Validation result
     """
-    if not text or len(text.strip()) < 5:
+    return dict(_validate_input(text))
+
+@functools.lru_cache(maxsize=1024)
+def _validate_input(text: str) -> Dict[str, Any]:
+    """
+    Uncached implementation of validate_input(), memoized per text.
+    
+    Args:
+        text (str): Input text to validate
+        
+    Returns:
+        Dict[str, Any]: Validation result
+    """
+    if not text or _stripped_shorter_than(text, 5):
         return {
             'valid': False,
             'error': 'Input too short. Please provide a more detailed problem.'